@@ -1,25 +1,37 @@
 """Oracle SCM Authentication Module"""
 
 import os
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import asyncio
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import webbrowser
 import requests
 from urllib.parse import urlencode, parse_qs
 import threading
 import time
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Tuple, Any
 import secrets
 import hashlib
 import base64
-import string
+import json
 import keyring
+import keyring.errors
 from mcp_oracle_scm.config.environment import get_env_config
 from mcp_oracle_scm.config.logger_config import LoggerConfig as Logger
 
+# Keychain storage: all token data lives in one JSON entry to keep keyring IPC to a single call
+KEYCHAIN_SERVICE = "mcp_oracle"
+KEYCHAIN_BUNDLE_KEY = "oauth_bundle"
+LEGACY_KEYCHAIN_KEYS = ("oauth_token", "oauth_token_expiry", "oauth_refresh_token")
+
+# Timeout in seconds for requests to the token endpoint
+TOKEN_REQUEST_TIMEOUT = 30
+
+# Seconds before expiry at which the access token is refreshed in the background
+TOKEN_REFRESH_LEAD = 600
+
 def generate_code_verifier() -> str:
     """Generate a code verifier for PKCE"""
-    chars = string.ascii_letters + string.digits + "-._~"
-    verifier = ''.join(secrets.choice(chars) for _ in range(128))
+    verifier = secrets.token_urlsafe(96)  # 128 base64url characters, RFC 7636 compliant
     Logger.log("Generated code verifier of length",
                       level="ERROR",
                       error_message=len(verifier))
@@ -29,7 +41,7 @@ def generate_code_verifier() -> str:
 def generate_code_challenge(verifier: str) -> str:
     """Generate a code challenge from the verifier using SHA256"""
     hash = hashlib.sha256(verifier.encode()).digest()
-    challenge = base64.b64encode(hash).decode().replace('+', '-').replace('/', '_').rstrip('=')
+    challenge = base64.urlsafe_b64encode(hash).rstrip(b'=').decode('ascii')
     Logger.log("Generated code challenge",
               level="DEBUG",
               challenge_length=len(challenge))
@@ -37,6 +49,7 @@ def generate_code_challenge(verifier: str) -> str:
 
 class OAuthCallbackHandler(BaseHTTPRequestHandler):
     auth_code = None
+    auth_done = threading.Event()
     
     def do_GET(self):
         """Handle the OAuth callback"""
@@ -47,6 +60,7 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
         
         if 'code' in query_components:
             OAuthCallbackHandler.auth_code = query_components['code'][0]
+            OAuthCallbackHandler.auth_done.set()
             Logger.log("Received authorization code",
                       level="INFO")
             self.send_response(200)
@@ -65,6 +79,43 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
         """Suppress default logging"""
         pass
 
+# Process-wide token cache keyed by client_id so that every OracleAuth instance
+# (and concurrent SOAP calls) share the current bearer without keychain round-trips
+_token_cache: Dict[str, Dict[str, Any]] = {}
+_token_cache_lock = threading.Lock()
+
+def _get_cached_tokens(client_id: str) -> Tuple[Optional[str], Optional[float], Optional[str]]:
+    """Get token data from the in-process cache"""
+    with _token_cache_lock:
+        entry = _token_cache.get(client_id)
+        if not entry:
+            return None, None, None
+        return entry['token'], entry['expiry'], entry['refresh_token']
+
+def _set_cached_tokens(client_id: str, token: Optional[str], expiry: Optional[float], refresh_token: Optional[str] = None):
+    """Store token data in the in-process cache, or drop the entry if there is no token"""
+    with _token_cache_lock:
+        if not token:
+            _token_cache.pop(client_id, None)
+            return
+        previous = _token_cache.get(client_id, {})
+        _token_cache[client_id] = {
+            'token': token,
+            'expiry': expiry,
+            'refresh_token': refresh_token or previous.get('refresh_token')
+        }
+
+def _is_invalid_grant(error: Exception) -> bool:
+    """Check whether a token request failed because the refresh token was rejected"""
+    response = getattr(error, 'response', None)
+    if response is None:
+        return False
+    try:
+        body = response.json()
+    except ValueError:
+        return False
+    return isinstance(body, dict) and body.get('error') == 'invalid_grant'
+
 class OracleAuth:
     def __init__(self, env_name: Optional[str] = None):
         """Initialize authentication using environment configuration"""
@@ -74,21 +125,38 @@ class OracleAuth:
         self.client_id = config['client_id']
         self.scope = config['scope']
         self.redirect_uri = "http://127.0.0.1:3009/callback"
-        self.access_token = None
-        self.token_expiry = None
-        self.refresh_token = None
+        self._connection_lock = threading.Lock()
+        # Keep-alive session so token exchanges and refreshes reuse the IDCS connection
+        self._http = requests.Session()
+        self._refresh_timer: Optional[threading.Timer] = None
+        
+        # Load token data once, preferring the in-process cache over the keychain
+        token, expiry, refresh_token = _get_cached_tokens(self.client_id)
+        if not token:
+            token, expiry, refresh_token = self.load_from_keychain()
+            _set_cached_tokens(self.client_id, token, expiry, refresh_token)
+        self.access_token = token
+        self.token_expiry = expiry
+        self.refresh_token = refresh_token
+        # A token restored from the cache or keychain still needs its background refresh
+        if token:
+            self._schedule_refresh()
         Logger.log("Initialized OracleAuth",
                   level="INFO",
                   env=config['env'],
                   client_id=self.client_id)
     
     def save_to_keychain(self, token: str, expiry_time: float, refresh_token: Optional[str] = None):
-        """Save authentication data to keychain"""
+        """Save authentication data to keychain as a single bundled entry"""
+        _set_cached_tokens(self.client_id, token, expiry_time, refresh_token)
+        # Keep the previously stored refresh token when the server did not issue a new one
+        _, _, refresh_token = _get_cached_tokens(self.client_id)
         try:
-            keyring.set_password("mcp_oracle", "oauth_token", token)
-            keyring.set_password("mcp_oracle", "oauth_token_expiry", str(expiry_time))
-            if refresh_token:
-                keyring.set_password("mcp_oracle", "oauth_refresh_token", refresh_token)
+            keyring.set_password(KEYCHAIN_SERVICE, KEYCHAIN_BUNDLE_KEY, json.dumps({
+                'token': token,
+                'expiry': expiry_time,
+                'refresh_token': refresh_token
+            }))
             Logger.log("Successfully saved token data to keychain",
                       level="INFO")
         except Exception as e:
@@ -99,11 +167,20 @@ class OracleAuth:
     def load_from_keychain(self) -> Tuple[Optional[str], Optional[float], Optional[str]]:
         """Load authentication data from keychain"""
         try:
-            token = keyring.get_password("mcp_oracle", "oauth_token")
-            expiry_str = keyring.get_password("mcp_oracle", "oauth_token_expiry")
-            refresh_token = keyring.get_password("mcp_oracle", "oauth_refresh_token")
+            bundle = keyring.get_password(KEYCHAIN_SERVICE, KEYCHAIN_BUNDLE_KEY)
+            if bundle:
+                data = json.loads(bundle)
+                expiry = data.get('expiry')
+                return data.get('token'), float(expiry) if expiry else None, data.get('refresh_token')
+            
+            # Fall back to the legacy one-entry-per-field format and migrate it
+            token = keyring.get_password(KEYCHAIN_SERVICE, "oauth_token")
+            expiry_str = keyring.get_password(KEYCHAIN_SERVICE, "oauth_token_expiry")
+            refresh_token = keyring.get_password(KEYCHAIN_SERVICE, "oauth_refresh_token")
             
             expiry = float(expiry_str) if expiry_str else None
+            if token or refresh_token:
+                self._migrate_legacy_keychain(token, expiry, refresh_token)
             
             return token, expiry, refresh_token
         except Exception as e:
@@ -111,13 +188,32 @@ class OracleAuth:
                       level="ERROR",
                       error=str(e))
             return None, None, None
+    
+    def _migrate_legacy_keychain(self, token: Optional[str], expiry: Optional[float], refresh_token: Optional[str]):
+        """Move legacy per-field keychain entries into the bundled entry"""
+        try:
+            keyring.set_password(KEYCHAIN_SERVICE, KEYCHAIN_BUNDLE_KEY, json.dumps({
+                'token': token,
+                'expiry': expiry,
+                'refresh_token': refresh_token
+            }))
+            for key in LEGACY_KEYCHAIN_KEYS:
+                try:
+                    keyring.delete_password(KEYCHAIN_SERVICE, key)
+                except keyring.errors.PasswordDeleteError:
+                    pass
+            Logger.log("Migrated legacy keychain entries",
+                      level="INFO")
+        except Exception as e:
+            Logger.log("Error migrating legacy keychain entries",
+                      level="ERROR",
+                      error=str(e))
             
     def clear_keychain(self):
         """Clear authentication data from keychain"""
+        _set_cached_tokens(self.client_id, None, None)
         try:
-            keyring.delete_password("mcp_oracle", "oauth_token")
-            keyring.delete_password("mcp_oracle", "oauth_token_expiry")
-            keyring.delete_password("mcp_oracle", "oauth_refresh_token")
+            keyring.delete_password(KEYCHAIN_SERVICE, KEYCHAIN_BUNDLE_KEY)
             Logger.log("Successfully cleared keychain data",
                       level="INFO")
         except Exception as e:
@@ -130,7 +226,9 @@ class OracleAuth:
         Logger.log("Starting local authentication server",
                   level="INFO")
         try:
-            server = HTTPServer(('127.0.0.1', 3009), OAuthCallbackHandler)
+            # Handle each request on its own daemon thread so stray browser requests
+            # (favicon, retries) never hold up the callback response
+            server = ThreadingHTTPServer(('127.0.0.1', 3009), OAuthCallbackHandler)
             server_thread = threading.Thread(target=server.serve_forever)
             server_thread.daemon = True
             server_thread.start()
@@ -139,6 +237,7 @@ class OracleAuth:
             
             # Reset the auth code
             OAuthCallbackHandler.auth_code = None
+            OAuthCallbackHandler.auth_done.clear()
             
             # Generate PKCE verifier and challenge
             code_verifier = generate_code_verifier()
@@ -154,9 +253,8 @@ class OracleAuth:
                 'code_challenge_method': 'S256'
             }
             auth_url = f"{self.auth_url}?{urlencode(auth_params)}"
-            Logger.log("Authorization URL generated",
-                      level="DEBUG",
-                      url=auth_url)
+            Logger.debug_lazy("Authorization URL generated",
+                              url=lambda: auth_url)
             
             # Open browser for authorization
             Logger.log("Opening browser for authorization",
@@ -165,19 +263,18 @@ class OracleAuth:
             
             # Wait for callback
             timeout = 300  # 5 minutes timeout
-            start_time = time.time()
-            while OAuthCallbackHandler.auth_code is None:
-                if time.time() - start_time > timeout:
-                    server.shutdown()
-                    Logger.log("Authorization timed out after 5 minutes",
-                             level="ERROR")
-                    raise TimeoutError("Authorization timed out after 5 minutes")
-                time.sleep(1)
+            if not OAuthCallbackHandler.auth_done.wait(timeout=timeout):
+                server.shutdown()
+                server.server_close()
+                Logger.log("Authorization timed out after 5 minutes",
+                         level="ERROR")
+                raise TimeoutError("Authorization timed out after 5 minutes")
                 
             auth_code = OAuthCallbackHandler.auth_code
             Logger.log("Successfully received authorization code",
                       level="INFO")
             server.shutdown()
+            server.server_close()
             return auth_code, code_verifier
         except Exception as e:
             Logger.log("Error in start_auth_server",
@@ -201,7 +298,7 @@ class OracleAuth:
             Logger.log("Making token request",
                       level="DEBUG",
                       url=self.token_url)
-            response = requests.post(self.token_url, data=token_params)
+            response = self._http.post(self.token_url, data=token_params, timeout=TOKEN_REQUEST_TIMEOUT)
             response.raise_for_status()
             
             token_data = response.json()
@@ -209,9 +306,8 @@ class OracleAuth:
                       level="INFO")
             
             self.access_token = token_data['access_token']
-            Logger.log("Access token received",
-                      level="DEBUG",
-                      token_length=len(self.access_token))
+            Logger.debug_lazy("Access token received",
+                              token_length=lambda: len(self.access_token))
             
             # Store token expiry if provided
             if 'expires_in' in token_data:
@@ -232,6 +328,7 @@ class OracleAuth:
                 self.token_expiry,
                 self.refresh_token if 'refresh_token' in token_data else None
             )
+            self._schedule_refresh()
                 
             return token_data
         except requests.exceptions.RequestException as e:
@@ -241,8 +338,13 @@ class OracleAuth:
                       response_text=e.response.text if hasattr(e.response, 'text') else None)
             raise
     
-    def refresh_access_token(self) -> Optional[str]:
-        """Refresh the access token using the refresh token"""
+    def refresh_access_token(self, keep_on_failure: bool = False) -> Optional[str]:
+        """Refresh the access token using the refresh token
+        
+        With keep_on_failure, a failed refresh leaves the current tokens and keychain
+        in place so a later on-demand refresh can retry; a rejected refresh token
+        (invalid_grant) always clears them.
+        """
         # Try to get refresh token from instance or keychain
         refresh_token = self.refresh_token
         if not refresh_token:
@@ -262,7 +364,7 @@ class OracleAuth:
         }
         
         try:
-            response = requests.post(self.token_url, data=token_params)
+            response = self._http.post(self.token_url, data=token_params, timeout=TOKEN_REQUEST_TIMEOUT)
             response.raise_for_status()
             token_data = response.json()
             
@@ -288,12 +390,17 @@ class OracleAuth:
                 self.token_expiry,
                 self.refresh_token if 'refresh_token' in token_data else None
             )
+            self._schedule_refresh()
                 
             return self.access_token
         except Exception as e:
+            invalid_grant = _is_invalid_grant(e)
             Logger.log("Error refreshing token",
                       level="ERROR",
-                      error=str(e))
+                      error=str(e),
+                      invalid_grant=invalid_grant)
+            if keep_on_failure and not invalid_grant:
+                return None
             # If refresh fails, clear stored tokens
             self.access_token = None
             self.refresh_token = None
@@ -301,8 +408,52 @@ class OracleAuth:
             self.clear_keychain()
             return None
     
+    def _schedule_refresh(self):
+        """Arm a timer that refreshes the access token shortly before it expires"""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        if not self.token_expiry:
+            return
+        delay = self.token_expiry - time.time() - TOKEN_REFRESH_LEAD
+        if delay <= 0:
+            # Too close to expiry; get_connection refreshes on demand
+            return
+        self._refresh_timer = threading.Timer(delay, self._background_refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+        Logger.log("Scheduled background token refresh",
+                  level="DEBUG",
+                  delay_seconds=int(delay))
+    
+    def _background_refresh(self):
+        """Refresh the access token off the request path"""
+        with self._connection_lock:
+            # Skip if a request already refreshed the token since this timer was armed
+            if self.token_expiry and time.time() < self.token_expiry - TOKEN_REFRESH_LEAD:
+                return
+            # Another instance may already have refreshed the shared token
+            token, expiry, refresh_token = _get_cached_tokens(self.client_id)
+            if token and expiry and time.time() < expiry - TOKEN_REFRESH_LEAD:
+                self.access_token = token
+                self.token_expiry = expiry
+                self.refresh_token = refresh_token or self.refresh_token
+                self._schedule_refresh()
+                return
+            Logger.log("Refreshing access token in background",
+                      level="INFO")
+            # The current token is still valid for a while, so keep it if this attempt fails
+            self.refresh_access_token(keep_on_failure=True)
+    
     def get_connection(self) -> Optional[str]:
         """Get a valid access token, requesting a new one if necessary"""
+        # Callers run this on worker threads; serialize them so concurrent requests
+        # never start parallel refreshes or authentication flows
+        with self._connection_lock:
+            return self._get_connection()
+    
+    def _get_connection(self) -> Optional[str]:
+        """Get a valid access token; must be called with the connection lock held"""
         Logger.log("Getting connection/access token",
                   level="INFO")
         
@@ -313,8 +464,20 @@ class OracleAuth:
                           level="INFO")
                 return self.access_token
                 
-        # Then try keychain
-        token, expiry, _ = self.load_from_keychain()
+        # Then try the in-process cache shared with other instances
+        token, expiry, refresh_token = _get_cached_tokens(self.client_id)
+        if token and expiry and time.time() < expiry - 300:  # 5 minute buffer
+            Logger.log("Using existing valid access token from cache",
+                      level="INFO")
+            self.access_token = token
+            self.token_expiry = expiry
+            self.refresh_token = refresh_token or self.refresh_token
+            return token
+        
+        # Then try keychain, but only if nothing was loaded into memory yet
+        token, expiry = None, None
+        if self.access_token is None:
+            token, expiry, _ = self.load_from_keychain()
         if token and expiry:
             try:
                 expiry_float = float(expiry)
@@ -323,6 +486,7 @@ class OracleAuth:
                              level="INFO")
                     self.access_token = token
                     self.token_expiry = expiry_float
+                    _set_cached_tokens(self.client_id, token, expiry_float)
                     return token
             except ValueError:
                 Logger.log("Invalid expiry time format in keychain",
@@ -352,6 +516,9 @@ class OracleAuth:
         """Clean up any resources"""
         Logger.log("Closing connection and clearing tokens",
                   level="INFO")
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
         self.access_token = None
         self.token_expiry = None
         self.refresh_token = None
@@ -359,18 +526,22 @@ class OracleAuth:
 
 # Initialize singleton instance
 _oracle_auth = None
+_oracle_auth_lock = threading.Lock()
 
 def get_oracle_auth() -> OracleAuth:
     """Get the singleton OracleAuth instance"""
     global _oracle_auth
     if _oracle_auth is None:
-        _oracle_auth = OracleAuth()
+        with _oracle_auth_lock:
+            if _oracle_auth is None:
+                _oracle_auth = OracleAuth()
     return _oracle_auth
 
 async def get_oauth_headers() -> Dict[str, str]:
     """Get OAuth headers for API requests"""
     auth = get_oracle_auth()
-    access_token = auth.get_connection()
+    # get_connection may hit the keychain, the token endpoint or the browser flow
+    access_token = await asyncio.to_thread(auth.get_connection)
     if not access_token:
         Logger.log("Failed to get access token",
                   level="ERROR")
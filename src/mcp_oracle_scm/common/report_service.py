@@ -1,27 +1,78 @@
 """Oracle Report Service Module"""
 
+import asyncio
 import base64
 import xml.etree.ElementTree as ET
+from string import Template
+from xml.sax.saxutils import escape
 from typing import Dict, Any, Optional, List, Tuple
 import aiohttp
 import csv
 import io
 import os
+import time
 from datetime import datetime
 import uuid
 from pathlib import Path
-from mcp_oracle_scm.common.auth import OracleAuth
+from mcp_oracle_scm.common.auth import get_oracle_auth
 from mcp_oracle_scm.config.environment import get_env_config
 from mcp_oracle_scm.config.logger_config import LoggerConfig as Logger
 
+# Namespace of the elements in PublicReportService SOAP responses
+PUBLIC_REPORT_NS = 'http://xmlns.oracle.com/oxp/service/PublicReportService'
+
+# SOAP envelope templates, compiled once at import
+PARAMETER_ITEM_TEMPLATE = Template("""
+                <pub:item>
+                    <pub:name>$name</pub:name>
+                    <pub:values>
+                        <pub:item>$value</pub:item>
+                    </pub:values>
+                </pub:item>""")
+
+RUN_REPORT_TEMPLATE = Template("""<?xml version="1.0" encoding="UTF-8"?>
+        <soap:Envelope xmlns:soap="http://www.w3.org/2003/05/soap-envelope" 
+                      xmlns:pub="http://xmlns.oracle.com/oxp/service/PublicReportService">
+            <soap:Header/>
+            <soap:Body>
+                <pub:runReport>
+                    <pub:reportRequest>
+                        <pub:parameterNameValues>$params_xml</pub:parameterNameValues>
+                        <pub:reportAbsolutePath>$report_path</pub:reportAbsolutePath>
+                        <pub:sizeOfDataChunkDownload>1</pub:sizeOfDataChunkDownload>
+                    </pub:reportRequest>
+                </pub:runReport>
+            </soap:Body>
+        </soap:Envelope>""")
+
+DOWNLOAD_CHUNK_TEMPLATE = Template("""<?xml version="1.0" encoding="UTF-8"?>
+        <soap:Envelope xmlns:soap="http://www.w3.org/2003/05/soap-envelope" 
+                      xmlns:pub="http://xmlns.oracle.com/oxp/service/PublicReportService">
+            <soap:Header/>
+            <soap:Body>
+                <pub:downloadReportDataChunk>
+                    <pub:fileID>$file_id</pub:fileID>
+                    <pub:beginIdx>$begin_idx</pub:beginIdx>
+                    <pub:size>$chunk_size</pub:size>
+                </pub:downloadReportDataChunk>
+            </soap:Body>
+        </soap:Envelope>""")
+
 class OracleReportService:
     """Oracle Report Service for executing and downloading BI reports."""
     
+    # Number of data chunks requested concurrently after the first chunk
+    CHUNK_CONCURRENCY = 4
+    
+    # HTTP session shared by all instances so SOAP calls reuse pooled connections
+    _session: Optional[aiohttp.ClientSession] = None
+    _session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
     def __init__(self):
         """Initialize using environment configuration."""
         config = get_env_config()
         self.base_url = config['base_url']
-        self.auth = OracleAuth()
+        self.auth = get_oracle_auth()
         self.base_url = self.base_url.rstrip('/')
         self.wsdl_url = f"{self.base_url}/xmlpserver/services/PublicReportWSSService?wsdl"
         self.soap_url = f"{self.base_url}/xmlpserver/services/PublicReportWSSService"
@@ -29,6 +80,20 @@ class OracleReportService:
         # Set downloads directory
         self.downloads_dir = os.path.expanduser("~/Downloads")
         
+        # Chunk sizing for report downloads; ORACLE_REPORT_CHUNK_SIZE overrides the initial size
+        report_config = config['api']['report']
+        self.max_chunk_size = report_config['max_chunk_size']
+        self.chunk_size = report_config['chunk_size']
+        chunk_size_override = os.environ.get("ORACLE_REPORT_CHUNK_SIZE")
+        if chunk_size_override:
+            try:
+                self.chunk_size = max(1, int(chunk_size_override))
+            except ValueError:
+                Logger.log("Invalid ORACLE_REPORT_CHUNK_SIZE, using default",
+                          level="WARNING",
+                          value=chunk_size_override,
+                          default=self.chunk_size)
+        
         Logger.log("Initialized Oracle Report Service",
                   level="INFO",
                   base_url=self.base_url)
@@ -48,10 +113,55 @@ class OracleReportService:
         filename = f"{report_name}_{timestamp}_{unique_id}.csv"
         return os.path.join(self.downloads_dir, filename)
 
-    async def _make_soap_request(self, soap_body: str) -> str:
-        """Make SOAP request to Oracle Report Service using OAuth."""
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use or for a new event loop."""
+        loop = asyncio.get_running_loop()
+        if cls._session is not None and cls._session_loop is not loop:
+            cls._release_stale_session()
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60)
+            )
+            cls._session_loop = loop
+        return cls._session
+
+    @classmethod
+    def _release_stale_session(cls):
+        """Close a shared session left behind by an event loop that is no longer current."""
+        session, loop = cls._session, cls._session_loop
+        cls._session = None
+        cls._session_loop = None
+        if session.closed:
+            return
+        if loop is not None and loop.is_running():
+            # The owning loop still runs on another thread, so close the session there
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        # The owning loop has stopped and can no longer await the close;
+        # shut the connector's pooled connections down directly instead
+        try:
+            session.connector.close()
+        except RuntimeError as e:
+            Logger.log("Failed to close stale HTTP session",
+                      level="WARNING",
+                      error=str(e))
+
+    @classmethod
+    async def aclose(cls):
+        """Close the shared HTTP session; called from the server lifespan on shutdown."""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+        cls._session_loop = None
+
+    async def _make_soap_request(self, soap_body: str) -> bytes:
+        """Make SOAP request to Oracle Report Service using OAuth.
+        
+        Returns the raw response body; the XML parser reads the encoding itself.
+        """
         # Get OAuth token
-        access_token = self.auth.get_connection()
+        access_token = await asyncio.to_thread(self.auth.get_connection)
         if not access_token:
             raise Exception("Failed to get OAuth access token")
 
@@ -63,26 +173,29 @@ class OracleReportService:
         Logger.log("Making SOAP request",
                   level="INFO",
                   url=self.soap_url)
-        Logger.log("Request details",
-                  level="DEBUG",
-                  body=soap_body)
+        if Logger.is_debug_enabled():
+            Logger.log("Request details",
+                      level="DEBUG",
+                      body_length=len(soap_body))
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.soap_url, data=soap_body, headers=headers) as response:
-                    response_text = await response.text()
+            session = self._get_session()
+            async with session.post(self.soap_url, data=soap_body, headers=headers) as response:
+                response_body = await response.read()
+                if Logger.is_debug_enabled():
                     Logger.log("Response received",
                              level="DEBUG",
                              status=response.status,
-                             body=response_text)
-                    
-                    if response.status != 200:
-                        Logger.log("SOAP request failed",
-                                 level="ERROR",
-                                 status=response.status,
-                                 response=response_text)
-                        raise Exception(f"SOAP request failed with status {response.status}: {response_text}")
-                    return response_text
+                             body_length=len(response_body))
+                
+                if response.status != 200:
+                    response_text = response_body.decode('utf-8', errors='replace')
+                    Logger.log("SOAP request failed",
+                             level="ERROR",
+                             status=response.status,
+                             response=response_text)
+                    raise Exception(f"SOAP request failed with status {response.status}: {response_text}")
+                return response_body
         except Exception as e:
             Logger.log("SOAP request error",
                       level="ERROR",
@@ -91,78 +204,68 @@ class OracleReportService:
 
     def _create_run_report_envelope(self, report_path: str, parameters: Optional[Dict[str, Any]] = None) -> str:
         """Create SOAP envelope for runReport request."""
-        # Create parameters XML if parameters provided
+        # Create parameters XML if parameters provided, escaping user supplied values
         params_xml = ""
         if parameters:
-            for name, value in parameters.items():
-                params_xml += f"""
-                <pub:item>
-                    <pub:name>{name}</pub:name>
-                    <pub:values>
-                        <pub:item>{value}</pub:item>
-                    </pub:values>
-                </pub:item>"""
+            params_xml = "".join(
+                PARAMETER_ITEM_TEMPLATE.substitute(name=escape(str(name)), value=escape(str(value)))
+                for name, value in parameters.items()
+            )
 
-        return f"""<?xml version="1.0" encoding="UTF-8"?>
-        <soap:Envelope xmlns:soap="http://www.w3.org/2003/05/soap-envelope" 
-                      xmlns:pub="http://xmlns.oracle.com/oxp/service/PublicReportService">
-            <soap:Header/>
-            <soap:Body>
-                <pub:runReport>
-                    <pub:reportRequest>
-                        <pub:parameterNameValues>{params_xml}</pub:parameterNameValues>
-                        <pub:reportAbsolutePath>{report_path}</pub:reportAbsolutePath>
-                        <pub:sizeOfDataChunkDownload>1</pub:sizeOfDataChunkDownload>
-                    </pub:reportRequest>
-                </pub:runReport>
-            </soap:Body>
-        </soap:Envelope>"""
+        return RUN_REPORT_TEMPLATE.substitute(
+            params_xml=params_xml,
+            report_path=escape(report_path)
+        )
 
-    def _create_download_chunk_envelope(self, file_id: str, begin_idx: int, chunk_size: int = 5000) -> str:
+    def _create_download_chunk_envelope(self, file_id: str, begin_idx: int, chunk_size: int) -> str:
         """Create SOAP envelope for downloadReportDataChunk request."""
-        return f"""<?xml version="1.0" encoding="UTF-8"?>
-        <soap:Envelope xmlns:soap="http://www.w3.org/2003/05/soap-envelope" 
-                      xmlns:pub="http://xmlns.oracle.com/oxp/service/PublicReportService">
-            <soap:Header/>
-            <soap:Body>
-                <pub:downloadReportDataChunk>
-                    <pub:fileID>{file_id}</pub:fileID>
-                    <pub:beginIdx>{begin_idx}</pub:beginIdx>
-                    <pub:size>{chunk_size}</pub:size>
-                </pub:downloadReportDataChunk>
-            </soap:Body>
-        </soap:Envelope>"""
+        return DOWNLOAD_CHUNK_TEMPLATE.substitute(
+            file_id=escape(file_id),
+            begin_idx=begin_idx,
+            chunk_size=chunk_size
+        )
 
-    def _parse_run_report_response(self, response_text: str) -> str:
-        """Parse runReport response to get report file ID."""
-        root = ET.fromstring(response_text)
-        ns = {
-            'env': 'http://www.w3.org/2003/05/soap-envelope',
-            'ns2': 'http://xmlns.oracle.com/oxp/service/PublicReportService'
-        }
+    def _find_response_elements(self, response: bytes, *tags: str) -> Dict[str, Optional[str]]:
+        """Stream-parse a SOAP response and collect the text of the requested elements.
         
-        # Find reportFileID element
-        file_id_elem = root.find('.//ns2:reportFileID', ns)
-        if file_id_elem is not None:
-            return file_id_elem.text
+        Elements are cleared as they are parsed and parsing stops once every tag has
+        been seen, so the full document tree is never kept in memory.
+        """
+        wanted = {f"{{{PUBLIC_REPORT_NS}}}{tag}": tag for tag in tags}
+        found = {}
+        for _, elem in ET.iterparse(io.BytesIO(response), events=('end',)):
+            tag = wanted.get(elem.tag)
+            if tag is not None:
+                found[tag] = elem.text
+                if len(found) == len(wanted):
+                    break
+            elem.clear()
+        return found
+
+    def _parse_run_report_response(self, response: bytes) -> str:
+        """Parse runReport response to get report file ID."""
+        found = self._find_response_elements(response, 'reportFileID')
+        if 'reportFileID' in found:
+            return found['reportFileID']
         raise Exception("Could not find reportFileID in response")
 
-    def _parse_download_chunk_response(self, response_text: str) -> Tuple[str, int]:
+    def _parse_download_chunk_response(self, response: bytes) -> Tuple[str, int]:
         """Parse downloadReportDataChunk response to get chunk data and offset."""
-        root = ET.fromstring(response_text)
-        ns = {
-            'env': 'http://www.w3.org/2003/05/soap-envelope',
-            'ns2': 'http://xmlns.oracle.com/oxp/service/PublicReportService'
-        }
+        found = self._find_response_elements(response, 'reportDataChunk', 'reportDataOffset')
         
-        # Find data chunk and offset
-        chunk_elem = root.find('.//ns2:reportDataChunk', ns)
-        offset_elem = root.find('.//ns2:reportDataOffset', ns)
-        
-        if chunk_elem is not None and offset_elem is not None:
-            return chunk_elem.text, int(offset_elem.text)
+        if 'reportDataChunk' in found and 'reportDataOffset' in found:
+            return found['reportDataChunk'], int(found['reportDataOffset'])
         raise Exception("Could not find reportDataChunk or reportDataOffset in response")
 
+    async def _download_chunk(self, file_id: str, begin_idx: int, chunk_size: int) -> Tuple[str, int]:
+        """Download and parse a single report data chunk."""
+        Logger.log("Downloading data chunk",
+                  level="DEBUG",
+                  start_index=begin_idx)
+        download_envelope = self._create_download_chunk_envelope(file_id, begin_idx, chunk_size)
+        response = await self._make_soap_request(download_envelope)
+        return self._parse_download_chunk_response(response)
+
     async def get_report_data(self, report_path: str, parameters: Optional[Dict[str, Any]] = None) -> str:
         """Run report and save data to a file.
         
@@ -192,46 +295,71 @@ class OracleReportService:
                       level="INFO",
                       file_id=file_id)
             
-            # Step 2: Download report data in chunks and write to file
+            # Step 2: Download report data in chunks and write to file.
+            # Once the first chunk shows there is more data, the following chunks are
+            # requested concurrently in batches and written back in begin_idx order.
+            # The chunk size doubles after each batch while throughput keeps improving.
             begin_idx = 0
-            chunk_size = 5000
+            chunk_size = self.chunk_size
             total_rows = 0
-            headers_written = False
+            batch_size = 1
+            best_throughput = 0.0
+            growing = chunk_size < self.max_chunk_size
             
-            # Initialize file for first chunk, then append subsequent chunks
-            first_chunk = True
-            while True:
-                Logger.log("Downloading data chunk",
-                          level="INFO",
-                          start_index=begin_idx)
-                
-                download_envelope = self._create_download_chunk_envelope(file_id, begin_idx, chunk_size)
-                response = await self._make_soap_request(download_envelope)
-                chunk_data, offset = self._parse_download_chunk_response(response)
-                
-                if chunk_data:
-                    # Decode base64 chunk
-                    decoded_data = base64.b64decode(chunk_data).decode('utf-8')
+            # The decoded chunks are already UTF-8 encoded CSV, so write raw bytes
+            # through a single handle for the whole download
+            with open(output_file, 'wb') as f:
+                done = False
+                while not done:
+                    begin_indexes = [begin_idx + i * chunk_size for i in range(batch_size)]
+                    batch_start = time.monotonic()
+                    batch_bytes = 0
+                    results = await asyncio.gather(
+                        *(self._download_chunk(file_id, idx, chunk_size) for idx in begin_indexes),
+                        return_exceptions=True
+                    )
                     
-                    # Open in write mode for first chunk, append mode for subsequent chunks
-                    mode = 'w' if first_chunk else 'a'
-                    with open(output_file, mode, newline='', encoding='utf-8') as f:
-                        f.write(decoded_data)
-                    
-                    # Count lines in this chunk (excluding empty lines)
-                    chunk_lines = sum(1 for line in decoded_data.splitlines() if line.strip())
-                    total_rows += chunk_lines
-                    
-                    Logger.log("Chunk processed",
-                             level="INFO",
-                             chunk_lines=chunk_lines,
-                             total_rows=total_rows)
-                    first_chunk = False
-                
-                if offset == -1:  # End of data
-                    break
+                    for result in results:
+                        # Chunks requested past the end of the data are dropped, so only
+                        # errors for chunks we actually need are raised
+                        if isinstance(result, BaseException):
+                            raise result
+                        chunk_data, offset = result
+                        
+                        if chunk_data:
+                            # Decode base64 chunk
+                            decoded_bytes = base64.b64decode(chunk_data)
+                            f.write(decoded_bytes)
+                            batch_bytes += len(decoded_bytes)
+                            
+                            # Count lines in this chunk
+                            chunk_lines = decoded_bytes.count(b'\n')
+                            total_rows += chunk_lines
+                            
+                            Logger.log("Chunk processed",
+                                     level="DEBUG",
+                                     chunk_lines=chunk_lines,
+                                     total_rows=total_rows)
+                        
+                        if offset == -1:  # End of data
+                            done = True
+                            break
+                        
+                    begin_idx = begin_indexes[-1] + chunk_size
+                    batch_size = self.CHUNK_CONCURRENCY
                     
-                begin_idx += chunk_size
+                    if growing and not done:
+                        elapsed = time.monotonic() - batch_start
+                        throughput = batch_bytes / elapsed if elapsed > 0 else 0.0
+                        if throughput > best_throughput:
+                            best_throughput = throughput
+                            chunk_size = min(chunk_size * 2, self.max_chunk_size)
+                            growing = chunk_size < self.max_chunk_size
+                            Logger.log("Increased report chunk size",
+                                     level="DEBUG",
+                                     chunk_size=chunk_size)
+                        else:
+                            growing = False
             
             Logger.log("Report download complete",
                       level="INFO",
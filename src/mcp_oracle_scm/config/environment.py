@@ -1,7 +1,8 @@
 """Oracle SCM Configuration Module"""
 
 import os
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
 # Oracle Environment Configuration
 ORACLE_CONFIGS = {
@@ -39,20 +40,29 @@ API_CONFIG = {
     'paths': {
         'base_api': '/fscmRestApi/resources/11.13.18.05',
         'soap_service': '/fscmService'
+    },
+    'report': {
+        'chunk_size': 10000,      # initial downloadReportDataChunk size
+        'max_chunk_size': 100000  # ceiling for adaptive chunk growth
     }
 }
 
-def get_env_config(env_name: Optional[str] = None) -> Dict[str, Any]:
+def _build_env_configs() -> Dict[str, Mapping[str, Any]]:
+    """Build the merged, read-only configuration for every environment"""
+    return {
+        env: MappingProxyType({**cfg, 'env': env, 'api': API_CONFIG})
+        for env, cfg in ORACLE_CONFIGS.items()
+    }
+
+# Merged per-environment configurations, precomputed at import
+_ENV_CONFIGS = _build_env_configs()
+
+def get_env_config(env_name: Optional[str] = None) -> Mapping[str, Any]:
     """Get Oracle configuration based on environment"""
     env = (env_name or os.environ.get("ORACLE_ENV", "DEV1")).upper()
     
-    if env not in ORACLE_CONFIGS:
+    config = _ENV_CONFIGS.get(env)
+    if config is None:
         raise ValueError(f"Invalid Oracle Environment: {env}. Valid values are: {', '.join(ORACLE_CONFIGS.keys())}")
     
-    config = ORACLE_CONFIGS[env].copy()
-    config.update({
-        'env': env,
-        'api': API_CONFIG
-    })
-    
     return config
@@ -7,7 +7,7 @@ import csv
 import os
 from datetime import datetime
 from typing import Dict, Any, List
-from mcp_oracle_scm.common.auth import OracleAuth
+from mcp_oracle_scm.common.auth import OracleAuth, get_oracle_auth
 from mcp_oracle_scm.config.environment import get_env_config
 from mcp_oracle_scm.config.logger_config import LoggerConfig as Logger
 
@@ -31,8 +31,7 @@ class OracleLocationManager:
 
     def __init__(self, config):
         self.base_url = config["base_url"]
-        # ✅ FIX: OracleAuth() doesn’t take arguments
-        self.auth =  OracleAuth()
+        self.auth = get_oracle_auth()
         Logger.log(
             "Initialized OracleLocationManager",
             level="INFO",
@@ -42,7 +41,7 @@ class OracleLocationManager:
 
     async def _get_auth_header(self) -> Dict[str, str]:
         """Retrieve OAuth header for Fusion API calls."""
-        access_token = self.auth.get_connection()
+        access_token = await asyncio.to_thread(self.auth.get_connection)
         if not access_token:
             raise Exception("Failed to get OAuth access token")
         return {
@@ -155,7 +154,7 @@ class OracleLocationManager:
 
         target_auth = OracleAuth(target_env)
         headers = {
-            "Authorization": f"Bearer {target_auth.get_connection()}",
+            "Authorization": f"Bearer {await asyncio.to_thread(target_auth.get_connection)}",
             "Content-Type": "application/json"
         }
 
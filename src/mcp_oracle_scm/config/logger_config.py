@@ -99,6 +99,42 @@ class LoggerConfig:
         finally:
             del frame  # Avoid reference cycles
 
+    @classmethod
+    def is_enabled_for(cls, level: str) -> bool:
+        """
+        Check whether a message at the given level would be written.
+        Lets hot paths skip building log context that would be discarded.
+        
+        Args:
+            level: The log level to check
+        """
+        instance = cls()
+        if not instance.debug_enabled or not instance._logger:
+            return False
+        message_level = level.upper()
+        return (message_level in cls.ALWAYS_LOG_LEVELS or
+                message_level == instance.debug_level)
+
+    @classmethod
+    def is_debug_enabled(cls) -> bool:
+        """Check whether DEBUG messages would be written."""
+        return cls.is_enabled_for("DEBUG")
+
+    @classmethod
+    def debug_lazy(cls, message: str, **kwargs) -> None:
+        """
+        Log a DEBUG message whose context values are zero-argument callables.
+        The callables are only invoked when DEBUG output is enabled, so
+        expensive context (URLs, payload sizes) costs nothing otherwise.
+        
+        Args:
+            message: The message to log
+            **kwargs: Callables producing the context values
+        """
+        if not cls.is_debug_enabled():
+            return
+        cls.log(message, level="DEBUG", **{k: v() for k, v in kwargs.items()})
+
     @classmethod
     def log(cls, message: str, level: Optional[str] = None, **kwargs) -> None:
         """
@@ -5,7 +5,7 @@ import os
 from typing import Dict, Any
 from mcp_oracle_scm.config.environment import get_env_config
 from mcp_oracle_scm.config.logger_config import LoggerConfig as Logger
-from mcp_oracle_scm.common.auth import OracleAuth
+from mcp_oracle_scm.common.auth import get_oracle_auth
 
 
 class SetupTaskCSVExportService:
@@ -20,8 +20,8 @@ class SetupTaskCSVExportService:
 
     async def _get_headers(self):
         """Generate authenticated headers."""
-        auth = OracleAuth()
-        token = auth.get_connection()
+        auth = get_oracle_auth()
+        token = await asyncio.to_thread(auth.get_connection)
         return {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
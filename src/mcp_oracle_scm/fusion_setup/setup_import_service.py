@@ -32,7 +32,7 @@ class SetupTaskCSVImportService:
         Logger.log("Initialized SetupTaskCSVImportService", level="INFO", env=self.env, base_url=self.base_url)
 
     async def _get_headers(self) -> Dict[str, str]:
-        token = self.auth.get_connection()   # SAME AUTH MECHANISM
+        token = await asyncio.to_thread(self.auth.get_connection)   # SAME AUTH MECHANISM
         if not token:
             raise Exception("Failed to obtain OAuth access token")
         return {
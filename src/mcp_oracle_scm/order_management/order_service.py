@@ -14,11 +14,10 @@ from enum import Enum
 import urllib.parse
 from pydantic import BaseModel, Field
 from mcp_oracle_scm.common.report_service import OracleReportService
-from mcp_oracle_scm.common.auth import OracleAuth
+from mcp_oracle_scm.common.auth import get_oracle_auth
 from mcp_oracle_scm.config.environment import get_env_config
 from mcp_oracle_scm.config.logger_config import LoggerConfig as Logger
 from mcp_oracle_scm.order_management.order_utils import (
-    process_order_report_row,
     format_order_response,
     format_order_summary,
 )
@@ -53,7 +52,7 @@ class EnvironmentConfig(BaseModel):
 class OracleOrderManager:
     def __init__(self, config: EnvironmentConfig):
         self.base_url = config.base_url
-        self.auth = OracleAuth()
+        self.auth = get_oracle_auth()
         Logger.log("Initialized OracleOrderManager",
                   level="INFO",
                   base_url=self.base_url)
@@ -67,7 +66,7 @@ class OracleOrderManager:
 
     async def _get_auth_header(self) -> Dict[str, str]:
         """Get the authorization header using OAuth token."""
-        access_token = self.auth.get_connection()
+        access_token = await asyncio.to_thread(self.auth.get_connection)
         if not access_token:
             raise Exception("Failed to get OAuth access token")
             
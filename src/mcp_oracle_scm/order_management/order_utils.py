@@ -1,26 +1,52 @@
 """Order Management Utilities"""
 
-from typing import Dict, Any, List
+import sys
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime
 from mcp_oracle_scm.config.logger_config import LoggerConfig as Logger
 
-def process_order_report_row(row: Dict[str, str]) -> Dict[str, Any]:
-    """Process a single row from the open orders report into a standardized format."""
+@lru_cache(maxsize=4096)
+def _parse_order_date(value: str) -> str:
+    """Convert a report date ("MM/DD/YYYY HH:MM:SS") to ISO format.
+    
+    Order dates repeat across the lines of an order, so results are memoized;
+    strptime still validates every distinct value, so impossible dates raise.
+    """
+    return datetime.strptime(value, "%m/%d/%Y %H:%M:%S").isoformat()
+
+def resolve_order_date_key(header: Iterable[str]) -> str:
+    """Find the ORDER_DATE column name in a report header.
+    
+    The column can carry a leading BOM, so callers should resolve it once per
+    file and pass it to process_order_report_row.
+    """
+    return next(key for key in header if key.endswith('ORDER_DATE'))
+
+def process_order_report_row(row: Dict[str, str], order_date_key: Optional[str] = None) -> Dict[str, Any]:
+    """Process a single row from the open orders report into a standardized format.
+    
+    Args:
+        row: The CSV row keyed by column name
+        order_date_key: The ORDER_DATE column name, as returned by resolve_order_date_key
+    """
     try:
-        # Handle BOM in column names by finding the ORDER_DATE column
-        order_date_key = next(key for key in row.keys() if key.endswith('ORDER_DATE'))
+        if order_date_key is None:
+            # Handle BOM in column names by finding the ORDER_DATE column
+            order_date_key = 'ORDER_DATE' if 'ORDER_DATE' in row else resolve_order_date_key(row)
         
         # Convert date string to ISO format
-        # Input format: "MM/DD/YYYY HH:MM:SS"
-        order_date = datetime.strptime(row[order_date_key].strip('"'), "%m/%d/%Y %H:%M:%S")
-        order_date_iso = order_date.isoformat()
+        order_date_iso = _parse_order_date(row[order_date_key].strip('"'))
         
         # Format line item
         line_item = {
             "item_number": row['ITEM_NUMBER'].strip('"'),
             "description": row['DESCRIPTION'].strip('"'),
             "ordered_quantity": int(row['ORDERED_QTY']),
-            "warehouse": row['ORGANIZATION_CODE'].strip('"')
+            "warehouse": sys.intern(row['ORGANIZATION_CODE'].strip('"'))
         }
         
         order_data = {
@@ -28,14 +54,16 @@ def process_order_report_row(row: Dict[str, str]) -> Dict[str, Any]:
             "order_date": order_date_iso,
             "order_id": row['ORDER_ID'].strip('"'),
             "source_order_id": row['SOURCE_ORDER_ID'].strip('"'),
-            "shipping_method": row['SHIPPING_METHOD'].strip('"'),
+            "shipping_method": sys.intern(row['SHIPPING_METHOD'].strip('"')),
             "line": line_item
         }
         
-        Logger.log("Order report row processed",
-                  level="DEBUG",
-                  order_number=order_data["order_number"],
-                  item_number=line_item["item_number"])
+        # Called once per row: skip building the log context unless DEBUG is on
+        if Logger.is_debug_enabled():
+            Logger.log("Order report row processed",
+                      level="DEBUG",
+                      order_number=order_data["order_number"],
+                      item_number=line_item["item_number"])
         
         return order_data
     except Exception as e:
@@ -45,103 +73,129 @@ def process_order_report_row(row: Dict[str, str]) -> Dict[str, Any]:
                   row_data=row)
         raise
 
+# Statuses tracked separately in the fulfillment summary; every other status counts as in progress
+_TERMINAL_STATUSES = ("Shipped", "Cancelled", "Not Started")
+_terminal_status_counts = itemgetter(*_TERMINAL_STATUSES)
+
+def count_line_statuses(line_statuses: List[str]) -> Tuple[Dict[str, int], int, int, int]:
+    """Count line statuses in a single pass.
+    
+    Counting runs inside Counter's C loop, so this stays cheap for bulk orders
+    with thousands of lines.
+    
+    Returns:
+        Tuple of (per-status counts, shipped, cancelled, not started)
+    """
+    counts = Counter(line_statuses)
+    return (dict(counts), *_terminal_status_counts(counts))
+
 def format_order_response(order_data: Dict[str, Any]) -> Dict[str, Any]:
     """Format order response data into a standardized structure."""
     try:
-        Logger.log("Formatting order response",
-                  level="DEBUG",
-                  order_number=order_data.get('OrderNumber'))
+        debug_enabled = Logger.is_debug_enabled()
+        if debug_enabled:
+            Logger.log("Formatting order response",
+                      level="DEBUG",
+                      order_number=order_data.get('OrderNumber'))
         
-        # Get all line statuses for analysis
+        # Format line items and collect statuses/warehouses for analysis in one pass
         line_statuses = []
         line_warehouses = set()
-        if 'lines' in order_data:
-            for line in order_data.get('lines', []):
-                if line.get('Status'):
-                    line_statuses.append(line.get('Status'))
-                if line.get('RequestedFulfillmentOrganizationCode'):
-                    line_warehouses.add(line.get('RequestedFulfillmentOrganizationCode'))
+        od = order_data.get
+        order_date = od('TransactionOn')
+        created_date = od('CreationDate')
+        lines_in = od('lines') or []
+        # Line count is known up front, so fill a preallocated list by index
+        formatted_lines = [None] * len(lines_in)
+        if lines_in:
+            for i, line in enumerate(lines_in):
+                g = line.get
+                status = g('Status')
+                if status:
+                    line_statuses.append(status)
+                warehouse = g('RequestedFulfillmentOrganizationCode')
+                if warehouse:
+                    line_warehouses.add(warehouse)
+                formatted_lines[i] = {
+                    "line_number": g('LineNumber'),
+                    "product": {
+                        "number": g('ProductNumber'),
+                        "description": g('ProductDescription')
+                    },
+                    "quantity": {
+                        "ordered": g('OrderedQuantity'),
+                        "shipped": g('ShippedQuantity'),
+                        "cancelled": g('CancelledQuantity'),
+                        "uom": g('OrderedUOMCode')
+                    },
+                    "price": {
+                        "unit": g('UnitSellingPrice'),
+                        "total": g('LineTotalAmount')
+                    },
+                    "status": status,
+                    "status_code": g('StatusCode'),
+                    "fulfill_line_id": g('FulfillLineId'),
+                    "warehouse": g('RequestedFulfillmentOrganizationCode', 'Not Assigned'),
+                    "dates": {
+                        "order_date": order_date,
+                        "created_date": created_date,
+                        "requested_ship_date": g('RequestedShipDate'),
+                        "schedule_ship_date": g('ScheduleShipDate'),
+                        "fulfillment_date": g('FulfillmentDate'),
+                        "last_update_date": g('LastUpdateDate')
+                    }
+                }
         
         # Determine overall status from line statuses
         overall_status = "Unknown"
-        status_counts = {}
+        line_count = len(line_statuses)
+        status_counts, shipped_count, cancelled_count, not_started_count = count_line_statuses(line_statuses)
         if line_statuses:
-            # Count occurrences of each status
-            for status in line_statuses:
-                status_counts[status] = status_counts.get(status, 0) + 1
-            
             # Logic to determine overall status based on line statuses
-            if all(status == "Shipped" for status in line_statuses):
+            if shipped_count == line_count:
                 overall_status = "Fully Shipped"
-            elif all(status == "Cancelled" for status in line_statuses):
+            elif cancelled_count == line_count:
                 overall_status = "Fully Cancelled"
-            elif any(status == "Shipped" for status in line_statuses):
+            elif shipped_count:
                 overall_status = "Partially Shipped"
-            elif any(status == "Not Started" for status in line_statuses):
+            elif not_started_count:
                 overall_status = "Not Started"
             else:
                 overall_status = "In Progress"
 
-        Logger.log("Order status determined",
-                  level="DEBUG",
-                  overall_status=overall_status,
-                  status_counts=status_counts)
+        if debug_enabled:
+            Logger.log("Order status determined",
+                      level="DEBUG",
+                      overall_status=overall_status,
+                      status_counts=status_counts)
 
         formatted_order = {
-            "order_number": order_data.get('OrderNumber'),
-            "source_order_number": order_data.get('SourceTransactionNumber'),
-            "source_transaction_system": order_data.get('SourceTransactionSystem'),
-            "source_transaction_id": order_data.get('SourceTransactionId'),
-            "purchase_order_number": order_data.get('CustomerPONumber'),
-            "business_unit": order_data.get('BusinessUnitName', 'Not Assigned'),
+            "order_number": od('OrderNumber'),
+            "source_order_number": od('SourceTransactionNumber'),
+            "source_transaction_system": od('SourceTransactionSystem'),
+            "source_transaction_id": od('SourceTransactionId'),
+            "purchase_order_number": od('CustomerPONumber'),
+            "business_unit": od('BusinessUnitName', 'Not Assigned'),
             "status": {
-                "header_status": order_data.get('Status', 'Unknown'),
+                "header_status": od('Status', 'Unknown'),
                 "order_status": overall_status,
                 "line_status_details": status_counts or {}
             },
-            "order_type": order_data.get('TransactionType', 'Standard'),
-            "order_date": order_data.get('TransactionOn'),
-            "created_date": order_data.get('CreationDate'),
-            "created_by": order_data.get('CreatedBy'),
+            "order_type": od('TransactionType', 'Standard'),
+            "order_date": order_date,
+            "created_date": created_date,
+            "created_by": od('CreatedBy'),
             "customer_info": {
-                "party_name": order_data.get('BuyingPartyName'),
-                "party_number": order_data.get('BuyingPartyNumber'),
-                "contact_name": order_data.get('BuyingPartyContactName'),
-                "contact_email": order_data.get('BuyingPartyContactEmail')
+                "party_name": od('BuyingPartyName'),
+                "party_number": od('BuyingPartyNumber'),
+                "contact_name": od('BuyingPartyContactName'),
+                "contact_email": od('BuyingPartyContactEmail')
             }
         }
 
         # Add line items if present
         if 'lines' in order_data:
-            formatted_order['lines'] = [{
-                "line_number": line.get('LineNumber'),
-                "product": {
-                    "number": line.get('ProductNumber'),
-                    "description": line.get('ProductDescription')
-                },
-                "quantity": {
-                    "ordered": line.get('OrderedQuantity'),
-                    "shipped": line.get('ShippedQuantity'),
-                    "cancelled": line.get('CancelledQuantity'),
-                    "uom": line.get('OrderedUOMCode')
-                },
-                "price": {
-                    "unit": line.get('UnitSellingPrice'),
-                    "total": line.get('LineTotalAmount')
-                },
-                "status": line.get('Status'),
-                "status_code": line.get('StatusCode'),
-                "fulfill_line_id": line.get('FulfillLineId'),
-                "warehouse": line.get('RequestedFulfillmentOrganizationCode', 'Not Assigned'),
-                "dates": {
-                    "order_date": order_data.get('TransactionOn'),
-                    "created_date": order_data.get('CreationDate'),
-                    "requested_ship_date": line.get('RequestedShipDate'),
-                    "schedule_ship_date": line.get('ScheduleShipDate'),
-                    "fulfillment_date": line.get('FulfillmentDate'),
-                    "last_update_date": line.get('LastUpdateDate')
-                }
-            } for line in order_data.get('lines', [])]
+            formatted_order['lines'] = formatted_lines
 
             # Add line summary
             formatted_order['line_summary'] = {
@@ -149,17 +203,18 @@ def format_order_response(order_data: Dict[str, Any]) -> Dict[str, Any]:
                 "status_summary": status_counts,
                 "warehouses": list(line_warehouses) if line_warehouses else ['Not Assigned'],
                 "fulfillment_progress": {
-                    "total_ordered_lines": len(line_statuses),
-                    "shipped_lines": sum(1 for status in line_statuses if status == "Shipped"),
-                    "cancelled_lines": sum(1 for status in line_statuses if status == "Cancelled"),
-                    "in_progress_lines": sum(1 for status in line_statuses if status not in ["Shipped", "Cancelled", "Not Started"])
+                    "total_ordered_lines": line_count,
+                    "shipped_lines": shipped_count,
+                    "cancelled_lines": cancelled_count,
+                    "in_progress_lines": line_count - shipped_count - cancelled_count - not_started_count
                 }
             }
 
-        Logger.log("Order response formatted",
-                  level="DEBUG",
-                  order_number=formatted_order["order_number"],
-                  total_lines=formatted_order.get('line_summary', {}).get('total_lines', 0))
+        if debug_enabled:
+            Logger.log("Order response formatted",
+                      level="DEBUG",
+                      order_number=formatted_order["order_number"],
+                      total_lines=formatted_order.get('line_summary', {}).get('total_lines', 0))
 
         return formatted_order
 
@@ -177,19 +232,16 @@ def format_order_summary(orders: List[Dict[str, Any]]) -> Dict[str, Any]:
                   level="DEBUG",
                   order_count=len(orders))
         
-        total_quantity = sum(order["total_quantity"] for order in orders)
-        warehouses = set()
-        items = set()
-        for order in orders:
-            warehouses.update(order["warehouses"])
-            for line in order.get("lines", []):
-                items.add(line["item_number"])
+        total_quantity = sum(map(itemgetter("total_quantity"), orders))
+        warehouses = set().union(*map(itemgetter("warehouses"), orders))
+        items = set(map(itemgetter("item_number"),
+                        chain.from_iterable(order.get("lines", []) for order in orders)))
 
         summary = {
             "total_orders": len(orders),
             "total_quantity": total_quantity,
-            "unique_warehouses": sorted(list(warehouses)),
-            "unique_items": sorted(list(items))
+            "unique_warehouses": sorted(warehouses),
+            "unique_items": sorted(items)
         }
 
         Logger.log("Order summary created",
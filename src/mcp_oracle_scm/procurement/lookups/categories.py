@@ -1,5 +1,6 @@
 """Category lookup functionality."""
 
+from types import MappingProxyType
 from typing import Dict
 from .base import BaseLookup
 
@@ -20,7 +21,7 @@ class CategoryLookup(BaseLookup):
     def __init__(self):
         """Initialize the category lookup."""
         super().__init__()
-        self._reverse_mapping = {v: k for k, v in self.STANDARD_CATEGORIES.items()}
+        self._reverse_mapping = _REVERSE_MAPPING
 
     def translate(self, value: str) -> str:
         """Translate a category name to its standard form.
@@ -64,3 +65,6 @@ class CategoryLookup(BaseLookup):
             The display name
         """
         return self._reverse_mapping.get(code, code)
+
+# Static tables shared by all instances, built once at import time
+_REVERSE_MAPPING = MappingProxyType({v: k for k, v in CategoryLookup.STANDARD_CATEGORIES.items()})
@@ -1,8 +1,16 @@
 """Supplier lookup functionality."""
 
-from typing import Dict, Set
+from types import MappingProxyType
+from typing import Dict, FrozenSet
 from .base import BaseLookup
 
+# Characters dropped during normalization, removed in a single translate pass
+_STRIP_TABLE = str.maketrans('', '', ' -.,')
+
+def _normalize_text(text: str) -> str:
+    """Normalize text for consistent lookup."""
+    return text.upper().translate(_STRIP_TABLE)
+
 class SupplierLookup(BaseLookup):
     """Lookup implementation for suppliers."""
 
@@ -56,21 +64,13 @@ class SupplierLookup(BaseLookup):
     def __init__(self):
         """Initialize the supplier lookup."""
         super().__init__()
-        self._supplier_reverse = {v: k for k, v in self.STANDARD_SUPPLIERS.items()}
-        self._site_reverse = {v: k for k, v in self.STANDARD_SITES.items()}
-        
-        # Create normalized lookup maps for case-insensitive matching
-        self._normalized_suppliers = {
-            self._normalize_text(k): v 
-            for k, v in {**self.STANDARD_SUPPLIERS, **self.SUPPLIER_ALIASES}.items()
-        }
-        
-        self._normalized_sites = {
-            self._normalize_text(k): v 
-            for k, v in {**self.STANDARD_SITES, **self.SITE_ALIASES}.items()
-        }
+        self._supplier_reverse = _SUPPLIER_REVERSE
+        self._site_reverse = _SITE_REVERSE
+        self._normalized_suppliers = _SUPPLIER_ALIAS_TO_STANDARD
+        self._normalized_sites = _SITE_ALIAS_TO_STANDARD
 
-    def _normalize_text(self, text: str) -> str:
+    @staticmethod
+    def _normalize_text(text: str) -> str:
         """Normalize text for consistent lookup.
         
         Args:
@@ -79,7 +79,7 @@ class SupplierLookup(BaseLookup):
         Returns:
             Normalized text
         """
-        return text.upper().replace(' ', '').replace('-', '').replace('.', '').replace(',', '')
+        return _normalize_text(text)
 
     def translate(self, value: str, is_site: bool = False) -> str:
         """Translate a supplier name or site to its standard form.
@@ -102,36 +102,8 @@ class SupplierLookup(BaseLookup):
         """
         if not value:
             return value
-
-        # Check cache first
-        cache_key = f"{'site' if is_site else 'supplier'}:{value}"
-        cached = self._get_cached(cache_key)
-        if cached:
-            return cached
-
-        # Normalize input
-        normalized = self._normalize_text(value)
-        
-        # Look up the standard form
-        if is_site:
-            # First check if it's already a standard site
-            if value in self.STANDARD_SITES:
-                standard = value
-            else:
-                # Look up in normalized sites
-                standard = self._normalized_sites.get(normalized, value)
-        else:
-            # First check if it's already a standard supplier
-            if value in self.STANDARD_SUPPLIERS:
-                standard = value
-            else:
-                # Look up in normalized suppliers
-                oracle_name = self._normalized_suppliers.get(normalized, value)
-                standard = oracle_name if oracle_name in self.STANDARD_SUPPLIERS else value
-        
-        # Cache and return
-        self._set_cached(cache_key, standard)
-        return standard
+        aliases = _SITE_ALIAS_TO_STANDARD if is_site else _SUPPLIER_ALIAS_TO_STANDARD
+        return aliases.get(_normalize_text(value), value)
 
     def get_code(self, value: str, is_site: bool = False) -> str:
         """Get the internal code for a supplier or site.
@@ -150,13 +122,10 @@ class SupplierLookup(BaseLookup):
             >>> lookup.get_code("HK", is_site=True)
             'HK_MAIN'
         """
-        # First translate to standard name
-        standard = self.translate(value, is_site)
-        
-        # Then get code
-        if is_site:
-            return self.STANDARD_SITES.get(standard, standard)
-        return self.STANDARD_SUPPLIERS.get(standard, standard)
+        if not value:
+            return value
+        codes = _SITE_ALIAS_TO_CODE if is_site else _SUPPLIER_ALIAS_TO_CODE
+        return codes.get(_normalize_text(value), value)
 
     def validate(self, value: str, is_site: bool = False) -> bool:
         """Validate if a supplier name or site is known.
@@ -204,7 +173,7 @@ class SupplierLookup(BaseLookup):
             return self._site_reverse.get(code, code)
         return self._supplier_reverse.get(code, code)
 
-    def get_all_variations(self, oracle_name: str) -> Set[str]:
+    def get_all_variations(self, oracle_name: str) -> FrozenSet[str]:
         """Get all known variations of a supplier name.
         
         Args:
@@ -221,16 +190,42 @@ class SupplierLookup(BaseLookup):
             >>> 'FXN' in variations
             True
         """
-        variations = {oracle_name}
-        
-        # Add the standard code
-        if oracle_name in self.STANDARD_SUPPLIERS:
-            variations.add(self.STANDARD_SUPPLIERS[oracle_name])
-            
-        # Add all aliases that map to this oracle name
-        variations.update(
-            alias for alias, std in self.SUPPLIER_ALIASES.items()
-            if std == oracle_name
-        )
-        
+        variations = _SUPPLIER_VARIATIONS.get(oracle_name)
+        if variations is None:
+            return frozenset((oracle_name,))
         return variations
+
+# Static tables shared by all instances, built once at import time
+_SUPPLIER_REVERSE = MappingProxyType({v: k for k, v in SupplierLookup.STANDARD_SUPPLIERS.items()})
+_SITE_REVERSE = MappingProxyType({v: k for k, v in SupplierLookup.STANDARD_SITES.items()})
+
+def _build_alias_table(standard: Dict[str, str], aliases: Dict[str, str]) -> Dict[str, str]:
+    """Map every normalized standard name and alias to its standard name."""
+    table = {_normalize_text(name): name for name in standard}
+    for alias, name in aliases.items():
+        table[_normalize_text(alias)] = name
+    return table
+
+# Normalized lookup maps for case-insensitive matching: one dict lookup per translate/get_code
+_SUPPLIER_ALIAS_TO_STANDARD = MappingProxyType(
+    _build_alias_table(SupplierLookup.STANDARD_SUPPLIERS, SupplierLookup.SUPPLIER_ALIASES))
+_SITE_ALIAS_TO_STANDARD = MappingProxyType(
+    _build_alias_table(SupplierLookup.STANDARD_SITES, SupplierLookup.SITE_ALIASES))
+_SUPPLIER_ALIAS_TO_CODE = MappingProxyType({
+    key: SupplierLookup.STANDARD_SUPPLIERS[name] for key, name in _SUPPLIER_ALIAS_TO_STANDARD.items()
+})
+_SITE_ALIAS_TO_CODE = MappingProxyType({
+    key: SupplierLookup.STANDARD_SITES[name] for key, name in _SITE_ALIAS_TO_STANDARD.items()
+})
+
+def _build_supplier_variations() -> Dict[str, FrozenSet[str]]:
+    """Invert the alias table: standard name -> name, code and all aliases."""
+    variations = {
+        name: {name, code} for name, code in SupplierLookup.STANDARD_SUPPLIERS.items()
+    }
+    for alias, name in SupplierLookup.SUPPLIER_ALIASES.items():
+        variations.setdefault(name, {name}).add(alias)
+    return {name: frozenset(names) for name, names in variations.items()}
+
+# Inverse alias index so get_all_variations is a single lookup
+_SUPPLIER_VARIATIONS = MappingProxyType(_build_supplier_variations())
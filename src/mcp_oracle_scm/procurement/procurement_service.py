@@ -68,7 +68,7 @@ DISPLAY FORMATTING GUIDELINES:
 
 COMMON ERROR HANDLING:
 1. PO Year Not Found Error:
-   When error message shows "cannot access local variable 'po' where it is not associated with a value":
+   When get_po_details returns total_results of 0 for the requested year:
    - ALWAYS fall back to get_po_summary without year parameter
    - Use the creation_date from summary to determine correct year
    - Retry get_po_details with correct year
@@ -132,16 +132,564 @@ IMPORTANT DATA HANDLING POLICY:
 - If data is unavailable, clearly indicate it is missing rather than making up values
 """
 
+import asyncio
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
 import csv
 import logging
+import os
+import re
+import time
+from collections import OrderedDict
 
 from mcp_oracle_scm.config.logger_config import LoggerConfig as Logger
 from mcp_oracle_scm.common.report_service import OracleReportService
 from .lookups.business_units import BusinessUnitLookup
 from .lookups.suppliers import SupplierLookup
 
+# BI Publisher reports behind the procurement tools
+_REPORT_FOLDER = "/Custom/Square SCM Reports/Block MCP/Procurement"
+PO_SUMMARY_REPORT = f"{_REPORT_FOLDER}/Block Procurement MCP Summary Report.xdo"
+PO_DETAIL_REPORT = f"{_REPORT_FOLDER}/Block Procurement MCP Detail Report.xdo"
+APPROVAL_QUEUE_REPORT = f"{_REPORT_FOLDER}/Block Procurement PO-PR in approvers queue.xdo"
+SUPPLIER_CONFIG_REPORT = f"{_REPORT_FOLDER}/Supplier Contacts and B2B Config Report.xdo"
+
+# Columns of the PO summary report read by _process_po_report_row
+PO_SUMMARY_COLUMNS = (
+    'CREATION_DATE', 'SHIP_TO_LOCATION', 'REQUISITIONING_BU', 'PROCUREMENT_BU', 'SUPPLIER',
+    'REQ_CNT', 'PO_CNT', 'CNT_CATEGORY', 'ITEM_CNT', 'ITEM_DESC_CNT', 'INV_PAY_STS'
+)
+# The same columns split by type, so each group is projected and converted in one call
+_PO_SUMMARY_TEXT_COLUMNS = (
+    'CREATION_DATE', 'SHIP_TO_LOCATION', 'REQUISITIONING_BU', 'PROCUREMENT_BU', 'SUPPLIER', 'INV_PAY_STS'
+)
+_PO_SUMMARY_COUNT_COLUMNS = ('REQ_CNT', 'PO_CNT', 'CNT_CATEGORY', 'ITEM_CNT', 'ITEM_DESC_CNT')
+
+# Four-digit year inside a report date, whatever its layout
+_YEAR_RE = re.compile(r'(?<!\d)(?:19|20)\d{2}(?!\d)')
+
+# Cell formatters bound once instead of building f-strings per cell
+_format_amount = "{:,.2f}".format
+_format_quantity = "{:,.0f}".format
+_format_price = "${:,.2f}".format
+_format_days = "{:.1f}".format
+
+def _truncate(text: str, width: int = 30) -> str:
+    """Shorten long text for table cells, marking the cut with '...'."""
+    return text[:width] + '...' if len(text) > width else text
+
+def _format_cell(value: Any) -> str:
+    """Render a single markdown table cell."""
+    if isinstance(value, (int, float)):
+        return f"{value:,}"
+    elif isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    elif value is None:
+        return ""
+    else:
+        # Escape pipe characters and handle empty strings
+        return str(value).replace("|", "\\|") or ""
+
+def _markdown_row(row: Iterable[Any], join: Callable[[Iterable[str]], str] = " | ".join) -> str:
+    """Render one markdown table line from a row of cell values."""
+    return f"| {join(map(_format_cell, row))} |"
+
+# Shared lookups behind memoized resolvers; user-supplied names repeat heavily across calls
+_supplier_lookup = SupplierLookup()
+_bu_lookup = BusinessUnitLookup()
+
+@lru_cache(maxsize=4096)
+def _resolve_supplier(name: str) -> Tuple[str, bool]:
+    """Translate a supplier name to its Oracle name and report whether it is known."""
+    oracle_supplier = _supplier_lookup.translate(name)
+    return oracle_supplier, _supplier_lookup.validate(oracle_supplier)
+
+@lru_cache(maxsize=4096)
+def _resolve_bu(name: str) -> Tuple[str, bool]:
+    """Translate a business unit name to its Oracle name and report whether it is known."""
+    oracle_bu = _bu_lookup.translate(name)
+    return oracle_bu, _bu_lookup.validate(oracle_bu)
+
+def clear_lookup_caches():
+    """Clear the memoized supplier and business unit translations, e.g. after a lookup table reload."""
+    _resolve_supplier.cache_clear()
+    _resolve_bu.cache_clear()
+    _supplier_lookup.clear_cache()
+    _bu_lookup.clear_cache()
+
+# Set MCP_TRIMMED_REPORTS=Yes when the BI reports are known to emit trimmed fields;
+# report rows read by position are then used as-is instead of stripping every value
+ENV_TRIMMED_REPORTS = "MCP_TRIMMED_REPORTS"
+_REPORTS_TRIMMED = os.getenv(ENV_TRIMMED_REPORTS, "No").upper() == "YES"
+
+def _safe_float(value: Optional[str]) -> float:
+    """Convert a report value to float, treating empty or non-numeric values as 0.0."""
+    try:
+        return float(value or 0)
+    except ValueError:
+        return 0.0
+
+def _safe_int(value: Optional[str]) -> int:
+    """Convert a report value to int, treating empty or non-numeric values as 0."""
+    try:
+        return int(value or 0)
+    except ValueError:
+        return 0
+
+def _to_float(value: Optional[str]) -> float:
+    """Convert a report value to float, treating empty or missing values as 0.0.
+    
+    Blank cells skip float() entirely; malformed numbers still raise ValueError.
+    """
+    return float(value) if value else 0.0
+
+def _join_categories(value: Union[str, List[str]]) -> str:
+    """Join a list of category codes into the report's pipe-separated form."""
+    return '|'.join(value) if isinstance(value, list) else value
+
+def _translate_supplier(value: str) -> str:
+    """Translate user input to the Oracle recognized supplier name."""
+    oracle_supplier, supplier_valid = _resolve_supplier(value)
+    if not supplier_valid:
+        Logger.log("Invalid supplier provided",
+                 level="WARNING",
+                 input_supplier=value,
+                 translated_supplier=oracle_supplier)
+    return oracle_supplier
+
+def _translate_bu(value: str) -> str:
+    """Translate user input to the Oracle recognized business unit name."""
+    oracle_bu, bu_valid = _resolve_bu(value)
+    if not bu_valid:
+        Logger.log("Invalid business unit provided",
+                 level="WARNING",
+                 input_bu=value,
+                 translated_bu=oracle_bu)
+    return oracle_bu
+
+# Report parameter specs: (report parameter, method argument, transform or None)
+_PO_SUMMARY_PARAMS = (
+    ('P_Year', 'year', str),
+    ('P_MPN', 'P_MPN', None),
+    ('P_Month', 'P_Month', None),
+    ('P_ITEM', 'P_ITEM', None),
+    ('P_PONUM', 'P_PONUM', None),
+    ('P_DOC_STATUS', 'P_DOC_STATUS', None),
+    ('P_REQ_NUM', 'P_REQ_NUM', None),
+    ('P_CATEGORY', 'P_CATEGORY', _join_categories),
+    ('P_SUPPLIER', 'P_SUPPLIER', _translate_supplier),
+    ('P_REQUESTER', 'P_REQUESTER', None),
+    ('P_MANUFACTURER', 'P_MANUFACTURER', None),
+)
+
+_PO_DETAIL_PARAMS = (
+    ('P_Year', 'year', str),
+    ('P_PROC_BU', 'P_PROC_BU', _translate_bu),
+    ('P_MPN', 'P_MPN', None),
+    ('P_Month', 'P_Month', str),
+    ('P_ITEM', 'P_ITEM', None),
+    ('P_PONUM', 'P_PONUM', None),
+    ('P_DOC_STATUS', 'P_DOC_STATUS', None),
+    ('P_REQ_NUM', 'P_REQ_NUM', None),
+    ('P_CATEGORY', 'P_CATEGORY', _join_categories),
+    ('P_SUPPLIER', 'P_SUPPLIER', _translate_supplier),
+    ('P_REQUESTER', 'P_REQUESTER', None),
+    ('P_MANUFACTURER', 'P_MANUFACTURER', None),
+    ('P_BUYER', 'P_BUYER', None),
+    ('P_SHIP_TO', 'P_SHIP_TO', None),
+    ('P_BILL_TO', 'P_BILL_TO', None),
+)
+
+_APPROVAL_PARAMS = (
+    ('P_DOC_NO', 'Doc_No', None),
+    ('P_DOC_TYPE', 'Doc_Type', None),
+    ('P_BU', 'BU', _translate_bu),
+    ('P_SKU', 'SKU', None),
+    ('P_SUPPLIER', 'Supplier', _translate_supplier),
+    ('P_CREATOR', 'Creator', None),
+)
+
+class _ReportResultCache:
+    """Small TTL cache for finished report responses, evicting the oldest entry when full."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        """Return a shallow copy of the cached response, so callers can add or replace keys freely."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            return None
+        return dict(value)
+
+    def set(self, key: Any, value: Dict[str, Any]):
+        self._entries[key] = (time.monotonic() + self.ttl, dict(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+# Responses for past years are immutable, so one process-wide cache serves every tool call
+_report_cache = _ReportResultCache(maxsize=256, ttl=600)
+
+class _InflightReports:
+    """Single-flight registry: concurrent identical report fetches share one request."""
+
+    def __init__(self):
+        self._tasks: Dict[Any, "asyncio.Task"] = {}
+
+    async def run(self, key: Any, fetch: Callable[[], Any]) -> Any:
+        """Await fetch() for key, joining a fetch already in flight for the same key.
+        
+        The fetch runs as its own task and callers await it through
+        asyncio.shield, so a cancelled caller does not cancel it for the others.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
+
+# One process-wide registry, so concurrent tool calls for the same report share a fetch
+_inflight_reports = _InflightReports()
+
+def _report_cache_key(
+    report_path: str,
+    params: Dict[str, Any],
+    year: Optional[int],
+    *variant: Any
+) -> Optional[tuple]:
+    """Cache key for a report call, or None when its data can still change.
+    
+    Current-year (or year-less) queries and unfiltered queries are never cached.
+    variant holds response-shaping options (formatting, paging) that are
+    cached separately for the same report data.
+    """
+    if not params or year is None or year >= datetime.now().year:
+        return None
+    return (report_path, frozenset(params.items()), variant)
+
+# Line items per PO returned by one get_po_details page; keeps large POs from
+# producing multi-megabyte responses
+PO_LINE_PAGE_SIZE = 500
+
+def _paginate_po_lines(
+    po_details: List[Dict[str, Any]],
+    page: int,
+    page_size: int
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Limit each PO's line items to one page.
+    
+    Returns the POs unchanged and no pagination info when every PO fits in
+    a single page; otherwise shallow PO copies holding only the requested
+    page of line items, plus the pagination details.
+    """
+    line_counts = {po["po_number"]: len(po["line_items"]) for po in po_details}
+    max_lines = max(line_counts.values(), default=0)
+    if max_lines <= page_size:
+        return po_details, None
+
+    start = (page - 1) * page_size
+    end = start + page_size
+    paged = [{**po, "line_items": po["line_items"][start:end]} for po in po_details]
+    return paged, {
+        "page": page,
+        "page_size": page_size,
+        "total_pages": -(-max_lines // page_size),
+        "total_line_items": line_counts
+    }
+
+@dataclass(slots=True)
+class PoSummaryRow:
+    """One processed row of the PO summary report.
+    
+    Slotted to keep large reports compact while they are aggregated and
+    tabulated; call to_dict() at the JSON boundary.
+    """
+    creation_date: str
+    ship_to_location: str
+    requisitioning_bu: str
+    procurement_bu: str
+    supplier: str
+    requisition_count: int
+    po_count: int
+    category_count: int
+    item_count: int
+    item_description_count: int
+    invoice_payment_status: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict layout returned in PO summary items."""
+        return {
+            "creation_date": self.creation_date,
+            "ship_to_location": self.ship_to_location,
+            "requisitioning_bu": self.requisitioning_bu,
+            "procurement_bu": self.procurement_bu,
+            "supplier": self.supplier,
+            "requisition_count": self.requisition_count,
+            "po_count": self.po_count,
+            "category_count": self.category_count,
+            "item_count": self.item_count,
+            "item_description_count": self.item_description_count,
+            "invoice_payment_status": self.invoice_payment_status
+        }
+
+# Column headers of the tables built by format_po_details
+_PO_SUMMARY_HEADERS = (
+    "PO Number", "Business Unit", "Requisitioning BU", "Supplier", "Supplier Site",
+    "Buyer", "PO Date", "PO Approval Date", "Status", "Total Amount", "Currency",
+    "EDI Status", "EDI Sent on", "Email to Supplier"
+)
+_PO_LOCATION_HEADERS = ("Ship To Location", "Bill To Location")
+_PO_LINE_HEADERS = (
+    "Line", "Item", "Description", "Category", "MPN", "Manufacturer", "Qty", "UOM",
+    "Unit Price", "Amount", "BPA Reference", "Requester"
+)
+_PO_TRACKING_HEADERS = (
+    "Line", "Item", "Ordered", "Received", "Invoiced", "Paid", "Need By Date",
+    "Promised Date", "Latest CO"
+)
+_PO_INVOICE_HEADERS = (
+    "Invoice Number", "Invoice Date", "Amount", "Currency", "Payment Status",
+    "Payment Date", "Payment Number", "Payment Method"
+)
+
+# Row projections for format_po_details; one itemgetter call reads all fields of a record
+_PO_LOCATION_FIELDS = itemgetter("ship_to_location", "bill_to_location")
+_PO_LINE_FIELDS = itemgetter(
+    "line_number", "item_number", "item_description", "category", "manufacturer_part_number",
+    "manufacturer", "quantity", "unit_of_measure", "unit_price", "amount", "BPA-BPALine", "Requester"
+)
+_PO_TRACKING_FIELDS = itemgetter(
+    "line_number", "item_number", "quantity", "received_quantity", "invoiced_quantity",
+    "paid_quantity", "need_by_date", "promised_date", "Latest CO"
+)
+_PO_INVOICE_FIELDS = itemgetter(
+    "invoice_number", "invoice_date", "invoice_amount", "currency_code", "payment_status",
+    "payment_date", "payment_number", "payment_method"
+)
+
+def _po_line_row(item: Dict[str, Any]) -> List[Any]:
+    """Build a Line Items table row for a PO line."""
+    (line_number, item_number, description, category, mpn, manufacturer,
+     quantity, uom, unit_price, amount, bpa_line, requester) = _PO_LINE_FIELDS(item)
+    return [
+        line_number, item_number, description, category, mpn, manufacturer,
+        _format_quantity(quantity), uom, _format_amount(unit_price), _format_amount(amount),
+        bpa_line, requester
+    ]
+
+def _po_tracking_row(item: Dict[str, Any]) -> List[Any]:
+    """Build an Order Tracking table row for a PO line."""
+    (line_number, item_number, quantity, received, invoiced, paid,
+     need_by_date, promised_date, latest_co) = _PO_TRACKING_FIELDS(item)
+    return [
+        line_number, item_number, _format_quantity(quantity), _format_quantity(received),
+        _format_quantity(invoiced), _format_quantity(paid), need_by_date, promised_date, latest_co
+    ]
+
+def _po_invoice_row(inv: Dict[str, Any]) -> List[Any]:
+    """Build an Invoice Details table row for an invoice line."""
+    (invoice_number, invoice_date, amount, currency_code, payment_status,
+     payment_date, payment_number, payment_method) = _PO_INVOICE_FIELDS(inv)
+    return [
+        invoice_number, invoice_date, _format_amount(amount), currency_code, payment_status,
+        payment_date, payment_number, payment_method
+    ]
+
+# Columns of the PO details report read by _process_po_detail_line, in the order it
+# unpacks them, with the value used when a column is missing (None reads as 0.0)
+_PO_DETAIL_LINE_COLUMNS = (
+    'LINE_NUMBER', 'ITEM', 'DESCRIPTION', 'CATEGORY', 'QTY', 'UNIT_PRICE', 'ORDERED_AMOUNT',
+    'REQUESTED_DELIVERY_DATE', 'PROMISED_DELIVERY_DATE', 'RECEIVED_QUANTITY', 'QUANTITY_BILLED',
+    'PAID_QUANTITY', 'UOM', 'MANUFACTURER', 'MPN', 'BPA_LINE', 'CO_NUM', 'REQUESTER_NAME'
+)
+_PO_DETAIL_LINE_DEFAULTS = (
+    0, '', '', '', None, None, None,
+    '', '', None, None,
+    None, '', '', '', '', '', ''
+)
+_PO_DETAIL_LINE_FIELDS = itemgetter(*_PO_DETAIL_LINE_COLUMNS)
+
+# Columns of the approval details report read by _process_approval_detail_row, in the
+# order _process_approval_detail_row_positional unpacks them
+_APPROVAL_COLUMNS = (
+    'DOCUMENT', 'DOCUMENTTYPE', 'LINE_NUM', 'Document_Creation_Date', 'Document_Submission_Date',
+    'Assignment_Date', 'Days_Elapsed', 'Time_Elapsed', 'Description', 'Assignee', 'Username',
+    'Assignee_s_Email', 'Assignee_s_Manager_ID', 'Assignee_s_Manager', 'Assignee_User_ID', 'OU',
+    'ITEM', 'QUANTITY', 'PRICE', 'EXTENDED_PRICE', 'LOCN_CODE', 'SUPPLIER', 'CHANGE_ORDER_DESC',
+    'CHANGE_ORDER_QTY', 'DOC_CREATOR'
+)
+
+# Output keys and report columns of the supplier configuration report; every field is text
+_SUPPLIER_CONFIG_FIELDS = (
+    ("SUPPLIER_NAME", "SUPPLIER_NAME"),
+    ("SUPPLIER_NUMBER", "SUPPLIER_NUMBER"),
+    ("PERSON_FIRST_NAME", "PERSON_FIRST_NAME"),
+    ("PERSON_LAST_NAME", "PERSON_LAST_NAME"),
+    ("USERNAME", "USERNAME"),
+    ("ACCESS_LEVEL", "ACCESS_LEVEL"),
+    ("ACCESS_TO", "ACCESS_TO"),
+    ("ROLE", "ROLE"),
+    ("EMAIL_ADDRESS", "EMAIL_ADDRESS"),
+    ("VENDOR_SITE_CODE", "VENDOR_SITE_CODE"),
+    ("NAME", "NAME"),
+    ("PURCHASING_SITE_FLAG", "PURCHASING_SITE_FLAG"),
+    ("RFQ_ONLY_SITE_FLAG", "RFQ_ONLY_SITE_FLAG"),
+    ("PAY_SITE_FLAG", "PAY_SITE_FLAG"),
+    ("PRIMARY_PAY_SITE_FLAG", "PRIMARY_PAY_SITE_FLAG"),
+    ("EFFECTIVE_START_DATE", "EFFECTIVE_START_DATE"),
+    ("EFFECTIVE_END_DATE", "EFFECTIVE_END_DATE"),
+    ("SUPPLIER_NOTIF_METHOD", "SUPPLIER_NOTIF_METHOD"),
+    ("Supplier Email Address", "PO_COMM_EMAIL"),
+    ("SERVICE_PROVIDER_NAME", "SERVICE_PROVIDER_NAME"),
+    ("B2B_COMM_METHOD_CODE", "B2B_COMM_METHOD_CODE"),
+    ("DOCS", "DOCS"),
+    ("last_update_date", "LAST_UPDATE_DATE"),
+    ("last_updated_by", "LAST_UPDATED_BY"),
+)
+_SUPPLIER_CONFIG_KEYS = tuple(key for key, _ in _SUPPLIER_CONFIG_FIELDS)
+_SUPPLIER_CONFIG_COLUMNS = tuple(column for _, column in _SUPPLIER_CONFIG_FIELDS)
+
+# (label, supplier config key) rows of the three _format_supplier_configs tables
+_SUPPLIER_DETAIL_FIELDS = (
+    ("Supplier Name", "SUPPLIER_NAME"),
+    ("Supplier Number", "SUPPLIER_NUMBER"),
+    ("Contact First Name", "PERSON_FIRST_NAME"),
+    ("Contact Last Name", "PERSON_LAST_NAME"),
+    ("Portal User Name", "USERNAME"),
+    ("Portal User Access", "ACCESS_LEVEL"),
+    ("Portal User Access To", "ACCESS_TO"),
+    ("Portal User Roles Access", "ROLE"),
+    ("Contact Email", "EMAIL_ADDRESS")
+)
+_SUPPLIER_SITE_FIELDS = (
+    ("Supplier Site", "VENDOR_SITE_CODE"),
+    ("Proc BU", "NAME"),
+    ("Purchasing Site Flag", "PURCHASING_SITE_FLAG"),
+    ("RFQ Site Flag", "RFQ_ONLY_SITE_FLAG"),
+    ("Pay Site Flag", "PAY_SITE_FLAG"),
+    ("Primary Pay Site Flag", "PRIMARY_PAY_SITE_FLAG"),
+    ("Eff Start Date", "EFFECTIVE_START_DATE"),
+    ("Eff End Date", "EFFECTIVE_END_DATE"),
+    ("Supplier Notification Method", "SUPPLIER_NOTIF_METHOD"),
+    ("Supplier Email Address", "Supplier Email Address")
+)
+_SUPPLIER_B2B_FIELDS = (
+    ("Supplier Site", "VENDOR_SITE_CODE"),
+    ("Proc BU", "NAME"),
+    ("Service Provider Name", "SERVICE_PROVIDER_NAME"),
+    ("B2B Comm Method", "B2B_COMM_METHOD_CODE"),
+    ("B2B Docs", "DOCS")
+)
+
+def _field_value_table(title: str, fields: Tuple[Tuple[str, str], ...]) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Precompute the constant parts of a Field/Value markdown table.
+    
+    Returns the title, header and separator lines as one string, and each
+    row's rendered label cell paired with its supplier config key, so only the
+    values are formatted per call.
+    """
+    head = f"\n### {title}\n\n| Field | Value |\n|{' --- |' * 2}\n"
+    return head, tuple((f"| {_format_cell(label)} | ", key) for label, key in fields)
+
+# Response key -> precomputed table for each _format_supplier_configs section
+_SUPPLIER_CONFIG_TABLES = {
+    "supplier_details": _field_value_table("Supplier Details", _SUPPLIER_DETAIL_FIELDS),
+    "site_details": _field_value_table("Supplier Site Details", _SUPPLIER_SITE_FIELDS),
+    "b2b_details": _field_value_table("Supplier Site B2B/EDI Details", _SUPPLIER_B2B_FIELDS)
+}
+
+@dataclass(slots=True)
+class ApprovalDetail:
+    """One processed row of the approval details report.
+    
+    Slotted to keep large approval queues compact while they are formatted;
+    call to_dict() at the JSON boundary.
+    """
+    document: str
+    document_type: str
+    line_num: int
+    document_creation_date: str
+    document_submission_date: str
+    assignment_date: str
+    days_elapsed: float
+    time_elapsed: str
+    description: str
+    assignee: str
+    username: str
+    assignee_email: str
+    assignee_manager_id: str
+    assignee_manager: str
+    assignee_user_id: str
+    ou: str
+    item: str
+    quantity: float
+    price: float
+    extended_price: float
+    location_code: str
+    supplier: str
+    change_order_desc: str
+    change_order_qty: float
+    doc_creator: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict layout returned in approval details items."""
+        return {
+            "document": self.document,
+            "document_type": self.document_type,
+            "line_num": self.line_num,
+            "document_creation_date": self.document_creation_date,
+            "document_submission_date": self.document_submission_date,
+            "assignment_date": self.assignment_date,
+            "days_elapsed": self.days_elapsed,
+            "time_elapsed": self.time_elapsed,
+            "description": self.description,
+            "assignee": self.assignee,
+            "username": self.username,
+            "assignee_email": self.assignee_email,
+            "assignee_manager_id": self.assignee_manager_id,
+            "assignee_manager": self.assignee_manager,
+            "assignee_user_id": self.assignee_user_id,
+            "ou": self.ou,
+            "item": self.item,
+            "quantity": self.quantity,
+            "price": self.price,
+            "extended_price": self.extended_price,
+            "location_code": self.location_code,
+            "supplier": self.supplier,
+            "change_order_desc": self.change_order_desc,
+            "change_order_qty": self.change_order_qty,
+            "doc_creator": self.doc_creator
+        }
+
+_APPROVAL_DETAIL_NAMES = tuple(field.name for field in fields(ApprovalDetail))
+_approval_detail_values = attrgetter(*_APPROVAL_DETAIL_NAMES)
+
+def _approval_columns(approval_details: Iterable[ApprovalDetail]) -> Dict[str, tuple]:
+    """Transpose approval records into one tuple per field, keyed by field name."""
+    return dict(zip(_APPROVAL_DETAIL_NAMES, zip(*map(_approval_detail_values, approval_details))))
+
+# Column accessors used to aggregate PoSummaryRow lists column by column
+_po_count = attrgetter('po_count')
+_requisition_count = attrgetter('requisition_count')
+_item_count = attrgetter('item_count')
+_category_count = attrgetter('category_count')
+_supplier = attrgetter('supplier')
+_requisitioning_bu = attrgetter('requisitioning_bu')
+
 class OracleProcurementManager:
     """Main class for managing Oracle Procurement operations.
     IMPORTANT: This class handles real Oracle SCM data. Never mock or fabricate data.
@@ -155,13 +703,45 @@ class OracleProcurementManager:
     - Tables include headers and proper alignment
     """
     
+    __slots__ = ('report_service', 'bu_lookup', 'supplier_lookup')
+    
     def __init__(self):
         """Initialize the Oracle Procurement Manager."""
         self.report_service = OracleReportService()
-        self.bu_lookup = BusinessUnitLookup()
-        self.supplier_lookup = SupplierLookup()
+        self.bu_lookup = _bu_lookup
+        self.supplier_lookup = _supplier_lookup
 
-    async def _process_report_data(self, report_data: Union[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _fill_params(params: Dict[str, Any], spec: tuple, arguments: Dict[str, Any]) -> None:
+        """Add every non-None argument named in spec to params, applying its transform.
+        
+        arguments must hold every argument the spec names; a missing one raises
+        KeyError rather than silently dropping a report filter.
+        """
+        for name, argument, transform in spec:
+            value = arguments[argument]
+            if value is not None:
+                params[name] = transform(value) if transform else value
+
+    async def _get_report_data(self, report_path: str, parameters: Dict[str, Any]) -> Any:
+        """Fetch a BI report, sharing the download with identical concurrent calls."""
+        try:
+            key = (report_path, frozenset(parameters.items()))
+        except TypeError:
+            # Unhashable parameter values; fetch without coalescing
+            return await self.report_service.get_report_data(
+                report_path=report_path,
+                parameters=parameters
+            )
+        return await _inflight_reports.run(
+            key,
+            lambda: self.report_service.get_report_data(
+                report_path=report_path,
+                parameters=parameters
+            )
+        )
+
+    async def _process_report_data(self, report_data: Union[str, List[Dict[str, Any]]]) -> List[PoSummaryRow]:
         """Process the report data.
          IMPORTANT: Never mock or fabricate data. All data must come directly from the report.
         If a field is missing or null, leave it empty - do not substitute with dummy values.
@@ -169,28 +749,22 @@ class OracleProcurementManager:
             report_data: Either a file path or list of dictionaries from the report
             
         Returns:
-            List of processed PO summary dictionaries
+            List of processed PO summary rows
         """
         summaries = []
         try:
-            # If report_data is an awaitable, await it
-            if hasattr(report_data, '__await__'):
-                report_data = await report_data
-
-            # If report_data is a string, treat it as a file path
+            # If report_data is a string, treat it as a file path; parse it on a worker
+            # thread so file I/O and row parsing do not block the event loop
             if isinstance(report_data, str):
-                with open(report_data, 'r', newline='', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    rows = list(reader)
+                summaries = await asyncio.to_thread(self._parse_csv_to_summaries, report_data)
             else:
                 # Otherwise, treat it as the row data directly
-                rows = report_data
-
-            # Process each row
-            for row in rows:
-                summary = self._process_po_report_row(row)
-                if summary:
-                    summaries.append(summary)
+                process_row = self._process_po_report_row
+                append = summaries.append
+                for row in report_data:
+                    summary = process_row(row)
+                    if summary:
+                        append(summary)
 
             return summaries
 
@@ -200,22 +774,181 @@ class OracleProcurementManager:
                       error_message=str(e))
             raise
 
-    def _process_po_report_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_csv_to_summaries(self, csv_path: str) -> List[PoSummaryRow]:
+        """Parse a PO summary report file into processed summary rows.
+        
+        Blocking; called through asyncio.to_thread from _process_report_data.
+        """
+        summaries = []
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return summaries
+            positions = {name: i for i, name in enumerate(header)}
+            if all(name in positions for name in PO_SUMMARY_COLUMNS):
+                # Resolve column positions once; itemgetter calls then project the
+                # text and count columns of a row in C
+                text_columns = itemgetter(*(positions[name] for name in _PO_SUMMARY_TEXT_COLUMNS))
+                count_columns = itemgetter(*(positions[name] for name in _PO_SUMMARY_COUNT_COLUMNS))
+                process_row = self._process_po_report_row_positional
+                append = summaries.append
+                for row in reader:
+                    # Blank lines are skipped, as csv.DictReader does
+                    if not row:
+                        continue
+                    summary = process_row(row, text_columns, count_columns)
+                    if summary:
+                        append(summary)
+            else:
+                # Columns are missing; fall back to keyed rows with defaults
+                f.seek(0)
+                process_row = self._process_po_report_row
+                append = summaries.append
+                for row in csv.DictReader(f):
+                    summary = process_row(row)
+                    if summary:
+                        append(summary)
+        return summaries
+
+    @staticmethod
+    def _iter_csv_rows(csv_path: str) -> Iterator[Dict[str, str]]:
+        """Yield the rows of a report file one at a time as they are read.
+        
+        Blocking; consume it on a worker thread through asyncio.to_thread.
+        Produces the same dicts as csv.DictReader, but zips each row with the
+        header directly instead of going through DictReader's per-row method.
+        """
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is not None:
+                yield from OracleProcurementManager._keyed_rows(header, reader)
+
+    @staticmethod
+    def _keyed_rows(header: List[str], reader: Iterable[List[str]]) -> Iterator[Dict[str, str]]:
+        """Key the remaining csv.reader rows by header, as csv.DictReader would."""
+        width = len(header)
+        for row in reader:
+            if len(row) == width:
+                yield dict(zip(header, row))
+            elif row:
+                # Short rows get None for missing fields and long rows keep the
+                # extra values under a None key, as csv.DictReader does
+                record = dict(zip(header, row))
+                if len(row) < width:
+                    record.update(dict.fromkeys(header[len(row):]))
+                else:
+                    record[None] = row[width:]
+                yield record
+
+    @staticmethod
+    def _collect_rows(
+        rows: Iterable[Dict[str, Any]],
+        process_row: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Process rows as they arrive, keeping the non-empty results.
+        
+        Given _iter_csv_rows, each row is dropped once processed, so a report
+        file is never held in memory as a full row list.
+        """
+        results = []
+        append = results.append
+        for row in rows:
+            result = process_row(row)
+            if result:
+                append(result)
+        return results
+
+    def _collect_csv_file(
+        self,
+        csv_path: str,
+        columns: Tuple[str, ...],
+        process_positional: Callable[[List[str], Callable[[List[str]], tuple]], Optional[Dict[str, Any]]],
+        process_row: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Process a report file row by row, indexing csv.reader rows by position.
+        
+        Blocking; called through asyncio.to_thread. When the header holds every
+        column in columns, rows are projected with one itemgetter call and
+        passed to process_positional, so no per-row dict is built. Otherwise the
+        same reader continues as keyed rows through process_row, which applies
+        defaults, so the file is opened and read only once either way.
+        """
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return []
+            positions = {name: i for i, name in enumerate(header)}
+            if all(name in positions for name in columns):
+                getter = itemgetter(*(positions[name] for name in columns))
+                results = []
+                append = results.append
+                for row in reader:
+                    # Blank lines are skipped, as csv.DictReader does
+                    if row:
+                        result = process_positional(row, getter)
+                        if result:
+                            append(result)
+                return results
+            return self._collect_rows(self._keyed_rows(header, reader), process_row)
+
+    def _process_po_report_row(self, row: Dict[str, Any]) -> Optional[PoSummaryRow]:
         """Process a single row from the purchase order report."""
         try:
-            return {
-                "creation_date": row.get('CREATION_DATE', '').strip(),
-                "ship_to_location": row.get('SHIP_TO_LOCATION', '').strip(),
-                "requisitioning_bu": row.get('REQUISITIONING_BU', '').strip(),
-                "procurement_bu": row.get('PROCUREMENT_BU', '').strip(),
-                "supplier": row.get('SUPPLIER', '').strip(),
-                "requisition_count": int(row.get('REQ_CNT', 0)),
-                "po_count": int(row.get('PO_CNT', 0)),
-                "category_count": int(row.get('CNT_CATEGORY', 0)),
-                "item_count": int(row.get('ITEM_CNT', 0)),
-                "item_description_count": int(row.get('ITEM_DESC_CNT', 0)),
-                "invoice_payment_status": row.get('INV_PAY_STS', '').strip()
-            }
+            g = row.get
+            return PoSummaryRow(
+                creation_date=g('CREATION_DATE', '').strip(),
+                ship_to_location=g('SHIP_TO_LOCATION', '').strip(),
+                requisitioning_bu=g('REQUISITIONING_BU', '').strip(),
+                procurement_bu=g('PROCUREMENT_BU', '').strip(),
+                supplier=g('SUPPLIER', '').strip(),
+                requisition_count=int(g('REQ_CNT', 0)),
+                po_count=int(g('PO_CNT', 0)),
+                category_count=int(g('CNT_CATEGORY', 0)),
+                item_count=int(g('ITEM_CNT', 0)),
+                item_description_count=int(g('ITEM_DESC_CNT', 0)),
+                invoice_payment_status=g('INV_PAY_STS', '').strip()
+            )
+        except Exception as e:
+            Logger.log("Error processing PO report row",
+                      level="ERROR",
+                      error_message=str(e),
+                      row_data=row)
+            return None
+
+    def _process_po_report_row_positional(
+        self,
+        row: List[str],
+        text_columns: Callable[[List[str]], tuple],
+        count_columns: Callable[[List[str]], tuple]
+    ) -> Optional[PoSummaryRow]:
+        """Process a csv.reader row of the purchase order report.
+        
+        Args:
+            row: Row values in file order
+            text_columns: itemgetter returning the _PO_SUMMARY_TEXT_COLUMNS values of a row, in order
+            count_columns: itemgetter returning the _PO_SUMMARY_COUNT_COLUMNS values of a row, in order
+        """
+        try:
+            (creation_date, ship_to_location, requisitioning_bu, procurement_bu, supplier,
+             inv_pay_sts) = text_columns(row)
+            # Convert all count columns in one map call rather than five int() lookups
+            req_cnt, po_cnt, cnt_category, item_cnt, item_desc_cnt = map(int, count_columns(row))
+            return PoSummaryRow(
+                creation_date.strip(),
+                ship_to_location.strip(),
+                requisitioning_bu.strip(),
+                procurement_bu.strip(),
+                supplier.strip(),
+                req_cnt,
+                po_cnt,
+                cnt_category,
+                item_cnt,
+                item_desc_cnt,
+                inv_pay_sts.strip()
+            )
         except Exception as e:
             Logger.log("Error processing PO report row",
                       level="ERROR",
@@ -223,25 +956,18 @@ class OracleProcurementManager:
                       row_data=row)
             return None
 
-    def _aggregate_summary_data(self, summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _aggregate_summary_data(self, summaries: List[PoSummaryRow]) -> Dict[str, Any]:
         """Aggregate summary data from processed PO summaries."""
         try:
-            total_pos = sum(s['po_count'] for s in summaries)
-            total_reqs = sum(s['requisition_count'] for s in summaries)
-            total_items = sum(s['item_count'] for s in summaries)
-            
-            # Get unique counts
-            unique_suppliers = len(set(s['supplier'] for s in summaries))
-            unique_bus = len(set(s['requisitioning_bu'] for s in summaries))
-            unique_categories = sum(s['category_count'] for s in summaries)
-            
+            # Reduce one column at a time; sum/set over map(attrgetter) run in C
+            # and only touch the fields that are aggregated
             return {
-                "total_pos": total_pos,
-                "total_requisitions": total_reqs,
-                "total_items": total_items,
-                "unique_suppliers": unique_suppliers,
-                "unique_business_units": unique_bus,
-                "unique_categories": unique_categories
+                "total_pos": sum(map(_po_count, summaries)),
+                "total_requisitions": sum(map(_requisition_count, summaries)),
+                "total_items": sum(map(_item_count, summaries)),
+                "unique_suppliers": len(set(map(_supplier, summaries))),
+                "unique_business_units": len(set(map(_requisitioning_bu, summaries))),
+                "unique_categories": sum(map(_category_count, summaries))
             }
             
         except Exception as e:
@@ -253,14 +979,15 @@ class OracleProcurementManager:
     def _create_markdown_table(
         self,
         headers: List[str],
-        rows: List[List[Any]],
+        rows: Iterable[List[Any]],
         title: str = ""
     ) -> str:
         """Create a proper markdown table that renders well in Goose UI.
         
         Args:
             headers: List of column headers
-            rows: List of rows, where each row is a list of values
+            rows: Rows to render, each a list of values; may be a generator, which
+                is consumed once while the rendered lines are joined
             title: Optional title for the table
             
          IMPORTANT: Never mock or fabricate data. All values must come from the actual data source.
@@ -272,41 +999,20 @@ class OracleProcurementManager:
         Returns:
             Markdown formatted table string
         """
-        def format_cell(value: Any) -> str:
-            if isinstance(value, (int, float)):
-                return f"{value:,}"
-            elif isinstance(value, datetime):
-                return value.strftime("%Y-%m-%d %H:%M:%S")
-            elif value is None:
-                return ""
-            else:
-                # Escape pipe characters and handle empty strings
-                return str(value).replace("|", "\\|") or ""
+        if not headers:
+            return ""
 
-        if not headers or not rows:
+        # Render every data row and join them in one call
+        body = "\n".join(map(_markdown_row, rows))
+        if not body:
             return ""
 
-        table = []
-        
         # Add title if provided
-        if title:
-            table.append(f"\n### {title}\n")
-        
-        # Add headers
-        table.append("| " + " | ".join(headers) + " |")
-        
-        # Add separator line with alignment
-        table.append("| " + " | ".join(["---" for _ in headers]) + " |")
-        
-        # Add data rows
-        for row in rows:
-            formatted_row = [format_cell(cell) for cell in row]
-            table.append("| " + " | ".join(formatted_row) + " |")
-        
-        # Add blank line after table
-        table.append("")
-        
-        return "\n".join(table)
+        heading = f"\n### {title}\n\n" if title else ""
+
+        # Headers, then the separator line with alignment; the body ends with a
+        # newline, leaving a blank line after the table
+        return f"{heading}| {' | '.join(headers)} |\n|{' --- |' * len(headers)}\n{body}\n"
 
     def _tabulate_po_summary(self, summary_data: Dict[str, Any]) -> str:
         """Create a markdown table of the PO summary data."""
@@ -337,7 +1043,7 @@ class OracleProcurementManager:
             title="Purchase Order Summary Report"
         )
 
-    def _tabulate_po_items(self, items: List[Dict[str, Any]]) -> str:
+    def _tabulate_po_items(self, items: List[PoSummaryRow]) -> str:
         """Create a markdown table of PO items."""
         if not items:
             return "No items found."
@@ -353,12 +1059,12 @@ class OracleProcurementManager:
         
         rows = [
             [
-                item['creation_date'],
-                item['ship_to_location'][:30] + '...' if len(item['ship_to_location']) > 30 else item['ship_to_location'],
-                item['requisitioning_bu'],
-                item['supplier'][:30] + '...' if len(item['supplier']) > 30 else item['supplier'],
-                item['po_count'],
-                item['item_count']
+                item.creation_date,
+                _truncate(item.ship_to_location),
+                item.requisitioning_bu,
+                _truncate(item.supplier),
+                item.po_count,
+                item.item_count
             ]
             for item in items
         ]
@@ -374,157 +1080,60 @@ class OracleProcurementManager:
         formatted_tables = {}
     
         for po in po_details:
-            # Format PO Header/Summary
-            summary_headers = [
-            "PO Number", "Business Unit", "Requisitioning BU", "Supplier", "Supplier Site",
-            "Buyer", "PO Date", "PO Approval Date", "Status", "Total Amount", "Currency",
-            "EDI Status", "EDI Sent on", "Email to Supplier"
-        ]
-        
-        summary_row = [
-            po["po_number"],
-            po["procurement_bu"],
-            po["requisitioning_bu"],
-            po["supplier"],
-            po["supplier_site"],
-            po["buyer"],
-            po["po_date"],
-            po.get("po_approval_date", ""),
-            po["po_status"],
-            f"{po['total_amount']:,.2f}",
-            po["currency_code"],
-            po.get("edi_status", ""),
-            po.get("edi_sent_on", ""),
-            po.get("email_to_supplier", "")
-        ]
-
-        # Add Shipping/Billing section
-        location_headers = [
-            "Ship To Location",
-            "Bill To Location"
-        ]
-        
-        location_row = [
-            po["ship_to_location"],
-            po["bill_to_location"]
-        ]
+            po_number = po["po_number"]
 
-        # Format Line Items with enhanced information
-        line_headers = [
-            "Line",
-            "Item",
-            "Description",
-            "Category",
-            "MPN",
-            "Manufacturer",
-            "Qty",
-            "UOM",
-            "Unit Price",
-            "Amount",
-            "BPA Reference",
-            "Requester"
-        ]
-            
-        line_rows = [
-            [
-                item["line_number"],
-                item["item_number"],
-                item["item_description"],
-                item["category"],
-                item["manufacturer_part_number"],
-                item["manufacturer"],
-                f"{item['quantity']:,.0f}",
-                item["unit_of_measure"],
-                f"{item['unit_price']:,.2f}",
-                f"{item['amount']:,.2f}",
-                item["BPA-BPALine"],
-                item["Requester"]
-            ]
-            for item in po["line_items"]
-        ]
-            
-        # Format Tracking Information with delivery dates
-        tracking_headers = [
-            "Line",
-            "Item",
-            "Ordered",
-            "Received",
-            "Invoiced",
-            "Paid",
-            "Need By Date",
-            "Promised Date",
-            "Latest CO"
-        ]
-        
-        tracking_rows = [
-            [
-                item["line_number"],
-                item["item_number"],
-                f"{item['quantity']:,.0f}",
-                f"{item['received_quantity']:,.0f}",
-                f"{item['invoiced_quantity']:,.0f}",
-                f"{item['paid_quantity']:,.0f}",
-                item["need_by_date"],
-                item["promised_date"],
-                item["Latest CO"]
+            # Format PO Header/Summary
+            summary_row = [
+                po_number,
+                po["procurement_bu"],
+                po["requisitioning_bu"],
+                po["supplier"],
+                po["supplier_site"],
+                po["buyer"],
+                po["po_date"],
+                po.get("po_approval_date", ""),
+                po["po_status"],
+                _format_amount(po['total_amount']),
+                po["currency_code"],
+                po.get("edi_status", ""),
+                po.get("edi_sent_on", ""),
+                po.get("email_to_supplier", "")
             ]
-            for item in po["line_items"]
-        ]
 
-        # Add new Invoice Lines table
-        invoice_headers = [
-            "Invoice Number",
-            "Invoice Date",
-            "Amount",
-            "Currency",
-            "Payment Status",
-            "Payment Date",
-            "Payment Number",
-            "Payment Method"
-        ]
-        
-        invoice_rows = [
-            [
-                inv["invoice_number"],
-                inv["invoice_date"],
-                f"{inv['invoice_amount']:,.2f}",
-                inv["currency_code"],
-                inv["payment_status"],
-                inv["payment_date"],
-                inv["payment_number"],
-                inv["payment_method"]
-            ]
-            for inv in po.get("invoice_lines", [])
-        ]
-        
-        # Store formatted tables for this PO
-        formatted_tables[po["po_number"]] = {
-            "summary": self._create_markdown_table(
-                headers=summary_headers,
-                rows=[summary_row],
-                title=f"Purchase Order Summary - {po['po_number']}"
-            ),
-            "locations": self._create_markdown_table(
-                headers=location_headers,
-                rows=[location_row],
-                title=f"Shipping & Billing Information - {po['po_number']}"
-            ),
-            "line_items": self._create_markdown_table(
-                headers=line_headers,
-                rows=line_rows,
-                title=f"Line Items - {po['po_number']}"
-            ),
-            "tracking": self._create_markdown_table(
-                headers=tracking_headers,
-                rows=tracking_rows,
-                title=f"Order Tracking - {po['po_number']}"
-            ),
-            "invoices": self._create_markdown_table(
-                headers=invoice_headers,
-                rows=invoice_rows,
-                title=f"Invoice Details - {po['po_number']}"
-            ) if po.get("invoice_lines") else "No invoice information available."
-        }
+            # Format Line Items, Tracking and Invoice rows lazily; the table
+            # writer consumes each map once
+            line_rows = map(_po_line_row, po["line_items"])
+            tracking_rows = map(_po_tracking_row, po["line_items"])
+            invoice_rows = map(_po_invoice_row, po.get("invoice_lines", []))
+            
+            # Store formatted tables for this PO
+            formatted_tables[po_number] = {
+                "summary": self._create_markdown_table(
+                    headers=_PO_SUMMARY_HEADERS,
+                    rows=[summary_row],
+                    title=f"Purchase Order Summary - {po_number}"
+                ),
+                "locations": self._create_markdown_table(
+                    headers=_PO_LOCATION_HEADERS,
+                    rows=[_PO_LOCATION_FIELDS(po)],
+                    title=f"Shipping & Billing Information - {po_number}"
+                ),
+                "line_items": self._create_markdown_table(
+                    headers=_PO_LINE_HEADERS,
+                    rows=line_rows,
+                    title=f"Line Items - {po_number}"
+                ),
+                "tracking": self._create_markdown_table(
+                    headers=_PO_TRACKING_HEADERS,
+                    rows=tracking_rows,
+                    title=f"Order Tracking - {po_number}"
+                ),
+                "invoices": self._create_markdown_table(
+                    headers=_PO_INVOICE_HEADERS,
+                    rows=invoice_rows,
+                    title=f"Invoice Details - {po_number}"
+                ) if po.get("invoice_lines") else "No invoice information available."
+            }
     
         return formatted_tables
 
@@ -540,61 +1149,50 @@ class OracleProcurementManager:
         P_CATEGORY: Optional[Union[str, List[str]]] = None,
         P_SUPPLIER: Optional[str] = None,
         P_REQUESTER: Optional[str] = None,
-        P_MANUFACTURER: Optional[str] = None
+        P_MANUFACTURER: Optional[str] = None,
+        *,
+        formatted: bool = True
     ) -> Dict[str, Any]:
-        """Get purchase order summary for a specific year using Oracle BI Report."""
+        """Get purchase order summary for a specific year using Oracle BI Report.
+        
+        Pass formatted=False to skip building the markdown tables when only
+        the summary and items data are needed; formatted_tables is then empty.
+        """
         try:
             start_time = datetime.now()
             
             # Use the correct report path
-            report_path = "/Custom/Square SCM Reports/Block MCP/Procurement/Block Procurement MCP Summary Report.xdo"
+            report_path = PO_SUMMARY_REPORT
             
             # Initialize parameters dict with only non-None values
             params = {}
+            self._fill_params(params, _PO_SUMMARY_PARAMS, {
+                'year': year,
+                'P_MPN': P_MPN,
+                'P_Month': P_Month,
+                'P_ITEM': P_ITEM,
+                'P_PONUM': P_PONUM,
+                'P_DOC_STATUS': P_DOC_STATUS,
+                'P_REQ_NUM': P_REQ_NUM,
+                'P_CATEGORY': P_CATEGORY,
+                'P_SUPPLIER': P_SUPPLIER,
+                'P_REQUESTER': P_REQUESTER,
+                'P_MANUFACTURER': P_MANUFACTURER,
+            })
             
-            # Handle year parameter
-            if year is not None:
-                params['P_Year'] = str(year)
-                
-            # Handle all other parameters
-            if P_MPN is not None:
-                params['P_MPN'] = P_MPN
-            if P_Month is not None:
-                params['P_Month'] = P_Month
-            if P_ITEM is not None:
-                params['P_ITEM'] = P_ITEM
-            if P_PONUM is not None:
-                params['P_PONUM'] = P_PONUM
-            if P_DOC_STATUS is not None:
-                params['P_DOC_STATUS'] = P_DOC_STATUS
-            if P_REQ_NUM is not None:
-                params['P_REQ_NUM'] = P_REQ_NUM
-            if P_CATEGORY is not None:
-                if isinstance(P_CATEGORY, list):
-                    params['P_CATEGORY'] = '|'.join(P_CATEGORY)
-                else:
-                    params['P_CATEGORY'] = P_CATEGORY
-            if P_SUPPLIER is not None:
-                # Translate user input to Oracle recognized supplier name
-                oracle_supplier = self.supplier_lookup.translate(P_SUPPLIER)
-                if not self.supplier_lookup.validate(oracle_supplier):
-                    Logger.log("Invalid supplier provided",
-                             level="WARNING",
-                             input_supplier=P_SUPPLIER,
-                             translated_supplier=oracle_supplier)
-                params["P_SUPPLIER"] = oracle_supplier
-            if P_REQUESTER is not None:
-                params['P_REQUESTER'] = P_REQUESTER
-            if P_MANUFACTURER is not None:
-                params['P_MANUFACTURER'] = P_MANUFACTURER
+            cache_key = _report_cache_key(report_path, params, year, formatted)
+            if cache_key is not None:
+                cached = _report_cache.get(cache_key)
+                if cached is not None:
+                    Logger.log("Returning cached PO summary", parameters=params)
+                    cached["execution_time"] = (datetime.now() - start_time).total_seconds()
+                    cached["cached"] = True
+                    return cached
             
             Logger.log("Getting PO summary data", parameters=params)
             
             # Get report data using filtered parameters
-            report_data = await self.report_service.get_report_data(
-                report_path=report_path,
-                parameters=params
-            )
+            report_data = await self._get_report_data(report_path, params)
             
             Logger.log("Processing PO summary data")
             
@@ -606,8 +1204,12 @@ class OracleProcurementManager:
                 summary = self._aggregate_summary_data(summaries)
                 
                 # Create tabulated views
-                summary_table = self._tabulate_po_summary(summary)
-                items_table = self._tabulate_po_items(summaries)
+                formatted_tables = {}
+                if formatted:
+                    formatted_tables = {
+                        "summary": self._tabulate_po_summary(summary),
+                        "items": self._tabulate_po_items(summaries)
+                    }
                 
                 # Calculate execution time
                 execution_time = (datetime.now() - start_time).total_seconds()
@@ -616,17 +1218,17 @@ class OracleProcurementManager:
                           execution_time=execution_time,
                           total_records=len(summaries))
                 
-                return {
+                result = {
                     "total_results": len(summaries),
                     "summary": summary,
-                    "items": summaries,
-                    "formatted_tables": {
-                        "summary": summary_table,
-                        "items": items_table
-                    },
+                    "items": [s.to_dict() for s in summaries],
+                    "formatted_tables": formatted_tables,
                     "execution_time": execution_time,
                     "parameters_used": params
                 }
+                if cache_key is not None:
+                    _report_cache.set(cache_key, result)
+                return result
                 
             except Exception as e:
                 Logger.log("Error processing PO summary data",
@@ -662,7 +1264,11 @@ class OracleProcurementManager:
         P_BUYER: Optional[str] = None,
         P_SHIP_TO: Optional[str] = None,
         P_BILL_TO: Optional[str] = None,
-        P_PROC_BU: Optional[str] = None
+        P_PROC_BU: Optional[str] = None,
+        *,
+        formatted: bool = True,
+        page: int = 1,
+        page_size: int = PO_LINE_PAGE_SIZE
     ) -> Dict[str, Any]:
         """Get detailed information for purchase orders using Oracle BI Report.
          - USE WHEN: Need detailed information about specific purchase orders
@@ -679,79 +1285,56 @@ class OracleProcurementManager:
    - EXAMPLE QUERIES:
      * "Show me all details for PO ABC123" (will automatically find year)
      * "Get PO details for XYZ789 from 2024" (uses specified year)
+   - Pass formatted=False to skip building formatted_tables when only items are needed
+   - POs with more than page_size line items return one page of lines at a time;
+     the response then carries a pagination entry, and later pages are fetched with page=2, 3, ...
         """
         try:
             # Validate year format
             if not isinstance(year, int) or len(str(year)) != 4:
                 raise ValueError("Year must be a 4-digit number (e.g., 2025)")
+            if page < 1 or page_size < 1:
+                raise ValueError("page and page_size must be positive integers")
             
             start_time = datetime.now()
             Logger.log("Getting PO details for year", level="INFO", year=year)
             
             # Use the correct report path
-            report_path = "/Custom/Square SCM Reports/Block MCP/Procurement/Block Procurement MCP Detail Report.xdo"
+            report_path = PO_DETAIL_REPORT
             
             # Prepare parameters - P_Year is case sensitive
-            parameters = {
-                "P_Year": str(year)
-            }
-
-            # Handle P_PROC_BU with business unit translation
-            if P_PROC_BU is not None:
-                # Translate user input to Oracle recognized business unit name
-                oracle_bu = self.bu_lookup.translate(P_PROC_BU)
-                if not self.bu_lookup.validate(oracle_bu):
-                    Logger.log("Invalid business unit provided",
-                             level="WARNING",
-                             input_bu=P_PROC_BU,
-                             translated_bu=oracle_bu)
-                parameters["P_PROC_BU"] = oracle_bu
-            
-            # Add other optional parameters if provided
-            if P_MPN is not None:
-                parameters["P_MPN"] = P_MPN
-            if P_Month is not None:
-                parameters["P_Month"] = str(P_Month)
-            if P_ITEM is not None:
-                parameters["P_ITEM"] = P_ITEM
-            if P_PONUM is not None:
-                parameters["P_PONUM"] = P_PONUM
-            if P_DOC_STATUS is not None:
-                parameters["P_DOC_STATUS"] = P_DOC_STATUS
-            if P_REQ_NUM is not None:
-                parameters["P_REQ_NUM"] = P_REQ_NUM
-            if P_CATEGORY is not None:
-                if isinstance(P_CATEGORY, list):
-                    parameters["P_CATEGORY"] = "|".join(P_CATEGORY)
-                else:
-                    parameters["P_CATEGORY"] = P_CATEGORY
-            if P_SUPPLIER is not None:
-                # Translate user input to Oracle recognized supplier name
-                oracle_supplier = self.supplier_lookup.translate(P_SUPPLIER)
-                if not self.supplier_lookup.validate(oracle_supplier):
-                    Logger.log("Invalid supplier provided",
-                             level="WARNING",
-                             input_supplier=P_SUPPLIER,
-                             translated_supplier=oracle_supplier)
-                parameters["P_SUPPLIER"] = oracle_supplier
-            if P_REQUESTER is not None:
-                parameters["P_REQUESTER"] = P_REQUESTER
-            if P_MANUFACTURER is not None:
-                parameters["P_MANUFACTURER"] = P_MANUFACTURER
-            if P_BUYER is not None:
-                parameters["P_BUYER"] = P_BUYER
-            if P_SHIP_TO is not None:
-                parameters["P_SHIP_TO"] = P_SHIP_TO
-            if P_BILL_TO is not None:
-                parameters["P_BILL_TO"] = P_BILL_TO
+            parameters = {}
+            self._fill_params(parameters, _PO_DETAIL_PARAMS, {
+                'year': year,
+                'P_PROC_BU': P_PROC_BU,
+                'P_MPN': P_MPN,
+                'P_Month': P_Month,
+                'P_ITEM': P_ITEM,
+                'P_PONUM': P_PONUM,
+                'P_DOC_STATUS': P_DOC_STATUS,
+                'P_REQ_NUM': P_REQ_NUM,
+                'P_CATEGORY': P_CATEGORY,
+                'P_SUPPLIER': P_SUPPLIER,
+                'P_REQUESTER': P_REQUESTER,
+                'P_MANUFACTURER': P_MANUFACTURER,
+                'P_BUYER': P_BUYER,
+                'P_SHIP_TO': P_SHIP_TO,
+                'P_BILL_TO': P_BILL_TO,
+            })
+
+            cache_key = _report_cache_key(report_path, parameters, year, formatted, page, page_size)
+            if cache_key is not None:
+                cached = _report_cache.get(cache_key)
+                if cached is not None:
+                    Logger.log("Returning cached PO details", level="INFO", parameters=parameters)
+                    cached["execution_time"] = (datetime.now() - start_time).total_seconds()
+                    cached["cached"] = True
+                    return cached
 
             Logger.log("Getting PO detail data with parameters", level="INFO", parameters=parameters)
             
             # Get report data
-            report_data = await self.report_service.get_report_data(
-                report_path=report_path,
-                parameters=parameters
-            )
+            report_data = await self._get_report_data(report_path, parameters)
             
             Logger.log("Processing PO details data", level="INFO")
             
@@ -759,8 +1342,11 @@ class OracleProcurementManager:
                 # Process the report data
                 po_details = await self._process_po_details_data(report_data)
                 
+                # Keep large POs to one page of line items
+                po_details, pagination = _paginate_po_lines(po_details, page, page_size)
+                
                 # Format tables
-                formatted_tables = self.format_po_details(po_details)
+                formatted_tables = self.format_po_details(po_details) if formatted else {}
                 
                 # Calculate execution time
                 execution_time = (datetime.now() - start_time).total_seconds()
@@ -768,13 +1354,18 @@ class OracleProcurementManager:
                           execution_time=execution_time,
                           total_records=len(po_details))
                 
-                return {
+                result = {
                     "total_results": len(po_details),
                     "items": po_details,
                     "execution_time": execution_time,
                     "parameters_used": parameters,
                     "formatted_tables": formatted_tables
                 }
+                if pagination is not None:
+                    result["pagination"] = pagination
+                if cache_key is not None:
+                    _report_cache.set(cache_key, result)
+                return result
                 
             except Exception as e:
                 Logger.log("Error processing PO details data",
@@ -795,42 +1386,63 @@ class OracleProcurementManager:
                 "parameters": {"year": year}
             }
 
+    @staticmethod
+    def _po_year_from_summary(summary: Dict[str, Any]) -> Optional[int]:
+        """Extract the PO creation year from a get_po_summary response."""
+        for item in summary.get("items") or []:
+            match = _YEAR_RE.search(item.get("creation_date", ""))
+            if match:
+                return int(match.group(0))
+        return None
+
+    async def get_po_details_auto(self, P_PONUM: str) -> Dict[str, Any]:
+        """Get PO details when the PO's creation year is not known.
+        
+        Runs the summary lookup for the creation year concurrently with a
+        speculative detail fetch for the current year. If the current year
+        matches, the summary lookup is cancelled; otherwise details are fetched
+        again with the year found by the summary.
+        
+        Args:
+            P_PONUM: Purchase order number
+        """
+        current_year = datetime.now().year
+        summary_task = asyncio.create_task(self.get_po_summary(P_PONUM=P_PONUM, formatted=False))
+        guess_task = asyncio.create_task(self.get_po_details(year=current_year, P_PONUM=P_PONUM))
+        try:
+            done, _ = await asyncio.wait({summary_task, guess_task}, return_when=asyncio.FIRST_COMPLETED)
+            if guess_task in done:
+                guess = guess_task.result()
+                if guess.get("total_results"):
+                    summary_task.cancel()
+                    return guess
+            
+            summary = await summary_task
+            year = self._po_year_from_summary(summary)
+            if year is None or year == current_year:
+                # Either the PO was not found at all or it belongs to the current year
+                return await guess_task
+            
+            guess_task.cancel()
+            Logger.log("PO found in a different year",
+                      level="INFO",
+                      po_number=P_PONUM,
+                      year=year)
+            return await self.get_po_details(year=year, P_PONUM=P_PONUM)
+        finally:
+            for task in (summary_task, guess_task):
+                if not task.done():
+                    task.cancel()
+
     async def _process_po_details_data(self, report_data: Union[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
         """Process the PO details report data."""
-        details = []
         try:
-            # If report_data is an awaitable, await it
-            if hasattr(report_data, '__await__'):
-                report_data = await report_data
-
-            # If report_data is a string, treat it as a file path
+            # If report_data is a string, treat it as a file path; the rows are
+            # streamed, grouped and processed on a worker thread
             if isinstance(report_data, str):
-                with open(report_data, 'r', newline='', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    rows = list(reader)
-            else:
-                # Otherwise, treat it as the row data directly
-                rows = report_data
-
-            if not rows:
-                return details
-
-            # Group rows by PO number
-            po_groups = {}
-            for row in rows:
-                po_number = row.get('PURCHASE_ORDER', '').strip()
-                if po_number:
-                    if po_number not in po_groups:
-                        po_groups[po_number] = []
-                    po_groups[po_number].append(row)
-
-            # Process each PO group
-            for po_number, po_rows in po_groups.items():
-                po_detail = self._process_po_detail_group(po_number, po_rows)
-                if po_detail:
-                    details.append(po_detail)
-
-            return details
+                return await asyncio.to_thread(self._build_po_details, self._iter_csv_rows(report_data))
+            # Otherwise, treat it as the row data directly
+            return self._build_po_details(report_data or ())
 
         except Exception as e:
             Logger.log("Error processing PO details data",
@@ -839,7 +1451,32 @@ class OracleProcurementManager:
                       data_type=type(report_data).__name__)
             raise
 
-    def _process_po_detail_group(self, po_number: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    @staticmethod
+    def _group_po_detail_rows(rows: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Group PO detail rows by PO number in one pass, keeping first-seen PO order.
+        
+        A single dict probe per row finds the group or starts a new one.
+        """
+        po_groups = {}
+        get_group = po_groups.get
+        for row in rows:
+            po_number = row.get('PURCHASE_ORDER', '').strip()
+            if po_number:
+                group = get_group(po_number)
+                if group is None:
+                    po_groups[po_number] = [row]
+                else:
+                    group.append(row)
+        return po_groups
+
+    def _build_po_details(self, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Group PO detail rows by PO number and process each group, in report order."""
+        po_groups = self._group_po_detail_rows(rows)
+        po_details = map(self._process_po_detail_group, po_groups.keys(), po_groups.values())
+        return [po_detail for po_detail in po_details if po_detail]
+
+    @staticmethod
+    def _process_po_detail_group(po_number: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Process a group of rows for a single PO.
          IMPORTANT: Never mock or fabricate data. All values must come directly from the report rows.
         If a field is missing or null, leave it empty - do not substitute with dummy values.
@@ -851,29 +1488,28 @@ class OracleProcurementManager:
             # Process line items
             line_items = []
             for row in rows:
-                line_item = self._process_po_detail_line(row)
+                line_item = OracleProcurementManager._process_po_detail_line(row)
                 if line_item:
                     line_items.append(line_item)
 
-            # Process invoice lines - collect unique invoice information
-            invoice_lines = []
-            seen_invoices = set()
+            # Process invoice lines - collect unique invoice information, keyed by
+            # invoice number so the first row seen for each invoice wins
+            invoices = {}
             
             for row in rows:
                 invoice_number = row.get('INV_NUMBER', '').strip()
-                if invoice_number and invoice_number not in seen_invoices:
-                    invoice_line = {
+                if invoice_number and invoice_number not in invoices:
+                    invoices[invoice_number] = {
                         'invoice_number': invoice_number,
                         'invoice_date': row.get('INV_DATE', '').strip(),
-                        'invoice_amount': float(row.get('INV_AMOUNT', 0)),
+                        'invoice_amount': _to_float(row.get('INV_AMOUNT')),
                         'payment_status': row.get('INV_PAY_STATUS', '').strip(),
                         'payment_date': row.get('INV_PAY_DATE', '').strip(),
                         'payment_number': row.get('INV_CHECK_NUM', '').strip(),
                         'payment_method': row.get('INV_PAY_METHOD', '').strip(),
                         'currency_code': row.get('PAY_CURR_CODE', '').strip()
                     }
-                    invoice_lines.append(invoice_line)
-                    seen_invoices.add(invoice_number)
+            invoice_lines = list(invoices.values())
 
             # Create the PO detail object
             po_detail = {
@@ -887,7 +1523,7 @@ class OracleProcurementManager:
                 "po_approval_date": header.get('PO_APPRVL_DT', '').strip(),
                 "currency_code": header.get('CURRENCY', '').strip(),
                 "po_status": header.get('PO_STATUS', '').strip(),
-                "total_amount": float(header.get('TOTAL_AMOUNT', 0)),
+                "total_amount": _to_float(header.get('TOTAL_AMOUNT')),
                 "edi_status": header.get('EDI_CHG_PO_STS', '').strip() or header.get('EDI_CRT_PO_STS', '').strip(),
                 "edi_sent_on": header.get('EDI_CHG_PO_DT', '').strip() or header.get('EDI_CRT_PO_DT', '').strip(),
                 "email_to_supplier": header.get('EMAIL_COMM_TO_SUPP', '').strip(),
@@ -906,32 +1542,49 @@ class OracleProcurementManager:
                   po_number=po_number)
         return None
 
-    def _process_po_detail_line(self, row: Dict[str, Any]) -> Dict[str, Any]:
-            """Process a single line item from the PO details."""
+    @staticmethod
+    def _process_po_detail_line(
+        row: Dict[str, Any],
+        to_float: Callable[[Optional[str]], float] = _to_float
+    ) -> Dict[str, Any]:
+        """Process a single line item from the PO details.
+        
+        Blank numeric cells read as 0.0 instead of rejecting the line. All
+        columns are fetched with one itemgetter call rather than one get each.
+        """
+        try:
             try:
-                return {
-                "line_number": int(row.get('LINE_NUMBER', 0)),
-                "item_number": row.get('ITEM', '').strip(),
-                "item_description": row.get('DESCRIPTION', '').strip(),
-                "category": row.get('CATEGORY', '').strip(),
-                "quantity": float(row.get('QTY', 0)),
-                "unit_price": float(row.get('UNIT_PRICE', 0)),
-                "amount": float(row.get('ORDERED_AMOUNT', 0)),
-                "need_by_date": row.get('REQUESTED_DELIVERY_DATE', '').strip(),
-                "promised_date": row.get('PROMISED_DELIVERY_DATE', '').strip(),
-                "received_quantity": float(row.get('RECEIVED_QUANTITY', 0)),
-                "invoiced_quantity": float(row.get('QUANTITY_BILLED', 0)),
-                "paid_quantity": float(row.get('PAID_QUANTITY', 0)),
-                "unit_of_measure": row.get('UOM', '').strip(),
-                "manufacturer": row.get('MANUFACTURER', '').strip(),
-                "manufacturer_part_number": row.get('MPN', '').strip(),
-                "BPA-BPALine": row.get('BPA_LINE', '').strip(),
-                "Latest CO": row.get('CO_NUM', '').strip(),
-                "Requester": row.get('REQUESTER_NAME', '').strip()
+                values = _PO_DETAIL_LINE_FIELDS(row)
+            except KeyError:
+                # The report lacks a column; read each one with its default instead
+                values = map(row.get, _PO_DETAIL_LINE_COLUMNS, _PO_DETAIL_LINE_DEFAULTS)
+            (line_number, item, description, category, quantity, unit_price, amount,
+             need_by_date, promised_date, received_quantity, invoiced_quantity,
+             paid_quantity, uom, manufacturer, mpn, bpa_line, co_num,
+             requester) = values
+            return {
+                "line_number": int(line_number),
+                "item_number": item.strip(),
+                "item_description": description.strip(),
+                "category": category.strip(),
+                "quantity": to_float(quantity),
+                "unit_price": to_float(unit_price),
+                "amount": to_float(amount),
+                "need_by_date": need_by_date.strip(),
+                "promised_date": promised_date.strip(),
+                "received_quantity": to_float(received_quantity),
+                "invoiced_quantity": to_float(invoiced_quantity),
+                "paid_quantity": to_float(paid_quantity),
+                "unit_of_measure": uom.strip(),
+                "manufacturer": manufacturer.strip(),
+                "manufacturer_part_number": mpn.strip(),
+                "BPA-BPALine": bpa_line.strip(),
+                "Latest CO": co_num.strip(),
+                "Requester": requester.strip()
             }
 
-            except Exception as e:
-                Logger.log("Error processing PO detail line",
+        except Exception as e:
+            Logger.log("Error processing PO detail line",
                       level="ERROR",
                       error_message=str(e),
                       row_data=row)
@@ -970,46 +1623,26 @@ class OracleProcurementManager:
             Logger.log("Getting PR/PO approval details", level="INFO")
             
             # Use the correct report path
-            report_path = "/Custom/Square SCM Reports/Block MCP/Procurement/Block Procurement PO-PR in approvers queue.xdo"
+            report_path = APPROVAL_QUEUE_REPORT
             
             # Initialize parameters dict
             parameters = {}
             
-            # Add optional parameters if provided
-            if Doc_No is not None:
-                parameters["P_DOC_NO"] = Doc_No
-            if Doc_Type is not None:
-                parameters["P_DOC_TYPE"] = Doc_Type
-            if BU is not None:
-                # Translate user input to Oracle recognized business unit name
-                oracle_bu = self.bu_lookup.translate(BU)
-                if not self.bu_lookup.validate(oracle_bu):
-                    Logger.log("Invalid business unit provided",
-                             level="WARNING",
-                             input_bu=BU,
-                             translated_bu=oracle_bu)
-                parameters["P_BU"] = oracle_bu
-            if SKU is not None:
-                parameters["P_SKU"] = SKU
-            if Supplier is not None:
-                # Translate user input to Oracle recognized supplier name
-                oracle_supplier = self.supplier_lookup.translate(Supplier)
-                if not self.supplier_lookup.validate(oracle_supplier):
-                    Logger.log("Invalid supplier provided",
-                             level="WARNING",
-                             input_supplier=Supplier,
-                             translated_supplier=oracle_supplier)
-                parameters["P_SUPPLIER"] = oracle_supplier
-            if Creator is not None:
-                parameters["P_CREATOR"] = Creator
+            # Add optional parameters if provided; BU and supplier go through the
+            # memoized translations
+            self._fill_params(parameters, _APPROVAL_PARAMS, {
+                'Doc_No': Doc_No,
+                'Doc_Type': Doc_Type,
+                'BU': BU,
+                'SKU': SKU,
+                'Supplier': Supplier,
+                'Creator': Creator,
+            })
 
             Logger.log("Getting approval details with parameters", level="INFO", parameters=parameters)
             
             # Get report data
-            report_data = await self.report_service.get_report_data(
-                report_path=report_path,
-                parameters=parameters
-            )
+            report_data = await self._get_report_data(report_path, parameters)
             
             Logger.log("Processing approval details data", level="INFO")
             
@@ -1028,7 +1661,7 @@ class OracleProcurementManager:
                 
                 return {
                     "total_results": len(approval_details),
-                    "items": approval_details,
+                    "items": [detail.to_dict() for detail in approval_details],
                     "execution_time": execution_time,
                     "parameters_used": parameters,
                     "formatted_tables": formatted_tables
@@ -1051,30 +1684,18 @@ class OracleProcurementManager:
                 "parameters": parameters
             }
 
-    async def _process_approval_details_data(self, report_data: Union[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    async def _process_approval_details_data(self, report_data: Union[str, List[Dict[str, Any]]]) -> List[ApprovalDetail]:
         """Process the approval details report data."""
-        details = []
         try:
-            # If report_data is an awaitable, await it
-            if hasattr(report_data, '__await__'):
-                report_data = await report_data
-
-            # If report_data is a string, treat it as a file path
+            # If report_data is a string, treat it as a file path streamed through
+            # the row processor on a worker thread
             if isinstance(report_data, str):
-                with open(report_data, 'r', newline='', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    rows = list(reader)
-            else:
-                # Otherwise, treat it as the row data directly
-                rows = report_data
-
-            # Process each row
-            for row in rows:
-                detail = self._process_approval_detail_row(row)
-                if detail:
-                    details.append(detail)
-
-            return details
+                return await asyncio.to_thread(
+                    self._collect_csv_file, report_data, _APPROVAL_COLUMNS,
+                    self._process_approval_detail_row_positional, self._process_approval_detail_row
+                )
+            # Otherwise, treat it as the row data directly
+            return self._collect_rows(report_data, self._process_approval_detail_row)
 
         except Exception as e:
             Logger.log("Error processing approval details data",
@@ -1083,49 +1704,104 @@ class OracleProcurementManager:
             raise
 
     
-    def _process_approval_detail_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
-        """Process a single row from the approval details."""
+    def _process_approval_detail_row(
+        self,
+        row: Dict[str, Any],
+        safe_float: Callable[[Optional[str]], float] = _safe_float,
+        safe_int: Callable[[Optional[str]], int] = _safe_int
+    ) -> Optional[ApprovalDetail]:
+        """Process a single row from the approval details.
+        
+        The converters are bound as defaults so the per-row calls are local lookups.
+        """
         try:
-            # Convert numeric values and handle empty strings
-            def safe_float(value: str) -> float:
-                try:
-                    return float(value) if value and value.strip() else 0.0
-                except ValueError:
-                    return 0.0
-
-            def safe_int(value: str) -> int:
-                try:
-                    return int(value) if value and value.strip() else 0
-                except ValueError:
-                    return 0
+            g = row.get
+            return ApprovalDetail(
+                document=g('DOCUMENT', '').strip(),
+                document_type=g('DOCUMENTTYPE', '').strip(),
+                line_num=safe_int(g('LINE_NUM', '0')),
+                document_creation_date=g('Document_Creation_Date', '').strip(),
+                document_submission_date=g('Document_Submission_Date', '').strip(),
+                assignment_date=g('Assignment_Date', '').strip(),
+                days_elapsed=safe_float(g('Days_Elapsed', '0')),
+                time_elapsed=g('Time_Elapsed', '').strip(),
+                description=g('Description', '').strip(),
+                assignee=g('Assignee', '').strip(),
+                username=g('Username', '').strip(),
+                assignee_email=g('Assignee_s_Email', '').strip(),
+                assignee_manager_id=g('Assignee_s_Manager_ID', '').strip(),
+                assignee_manager=g('Assignee_s_Manager', '').strip(),
+                assignee_user_id=g('Assignee_User_ID', '').strip(),
+                ou=g('OU', '').strip(),
+                item=g('ITEM', '').strip(),
+                quantity=safe_float(g('QUANTITY', '0')),
+                price=safe_float(g('PRICE', '0')),
+                extended_price=safe_float(g('EXTENDED_PRICE', '0')),
+                location_code=g('LOCN_CODE', '').strip(),
+                supplier=g('SUPPLIER', '').strip(),
+                change_order_desc=g('CHANGE_ORDER_DESC', '').strip(),
+                change_order_qty=safe_float(g('CHANGE_ORDER_QTY', '0')),
+                doc_creator=safe_float(g('DOC_CREATOR', '0'))
+            )
 
-            return {
-                "document": row.get('DOCUMENT', '').strip(),
-                "document_type": row.get('DOCUMENTTYPE', '').strip(),
-                "line_num": safe_int(row.get('LINE_NUM', '0')),
-                "document_creation_date": row.get('Document_Creation_Date', '').strip(),
-                "document_submission_date": row.get('Document_Submission_Date', '').strip(),
-                "assignment_date": row.get('Assignment_Date', '').strip(),
-                "days_elapsed": safe_float(row.get('Days_Elapsed', '0')),
-                "time_elapsed": row.get('Time_Elapsed', '').strip(),
-                "description": row.get('Description', '').strip(),
-                "assignee": row.get('Assignee', '').strip(),
-                "username": row.get('Username', '').strip(),
-                "assignee_email": row.get('Assignee_s_Email', '').strip(),
-                "assignee_manager_id": row.get('Assignee_s_Manager_ID', '').strip(),
-                "assignee_manager": row.get('Assignee_s_Manager', '').strip(),
-                "assignee_user_id": row.get('Assignee_User_ID', '').strip(),
-                "ou": row.get('OU', '').strip(),
-                "item": row.get('ITEM', '').strip(),
-                "quantity": safe_float(row.get('QUANTITY', '0')),
-                "price": safe_float(row.get('PRICE', '0')),
-                "extended_price": safe_float(row.get('EXTENDED_PRICE', '0')),
-                "location_code": row.get('LOCN_CODE', '').strip(),
-                "supplier": row.get('SUPPLIER', '').strip(),
-                "change_order_desc": row.get('CHANGE_ORDER_DESC', '').strip(),
-                "change_order_qty": safe_float(row.get('CHANGE_ORDER_QTY', '0')),
-                "doc_creator": safe_float(row.get('DOC_CREATOR', '0'))
-            }
+        except Exception as e:
+            Logger.log("Error processing approval detail row",
+                      level="ERROR",
+                      error_message=str(e),
+                      row_data=row)
+            return None
+
+    def _process_approval_detail_row_positional(
+        self,
+        row: List[str],
+        columns: Callable[[List[str]], tuple],
+        trimmed: bool = _REPORTS_TRIMMED,
+        safe_float: Callable[[Optional[str]], float] = _safe_float,
+        safe_int: Callable[[Optional[str]], int] = _safe_int
+    ) -> Optional[ApprovalDetail]:
+        """Process a csv.reader row of the approval details report.
+        
+        Args:
+            row: Row values in file order
+            columns: itemgetter returning the _APPROVAL_COLUMNS values of a row, in order
+            trimmed: Skip stripping the values (see ENV_TRIMMED_REPORTS)
+        """
+        try:
+            values = columns(row)
+            if not trimmed:
+                values = map(str.strip, values)
+            (document, document_type, line_num, creation_date, submission_date,
+             assignment_date, days_elapsed, time_elapsed, description, assignee, username,
+             assignee_email, manager_id, manager, assignee_user_id, ou,
+             item, quantity, price, extended_price, location_code, supplier, change_order_desc,
+             change_order_qty, doc_creator) = values
+            return ApprovalDetail(
+                document,
+                document_type,
+                safe_int(line_num),
+                creation_date,
+                submission_date,
+                assignment_date,
+                safe_float(days_elapsed),
+                time_elapsed,
+                description,
+                assignee,
+                username,
+                assignee_email,
+                manager_id,
+                manager,
+                assignee_user_id,
+                ou,
+                item,
+                safe_float(quantity),
+                safe_float(price),
+                safe_float(extended_price),
+                location_code,
+                supplier,
+                change_order_desc,
+                safe_float(change_order_qty),
+                safe_float(doc_creator)
+            )
 
         except Exception as e:
             Logger.log("Error processing approval detail row",
@@ -1134,7 +1810,7 @@ class OracleProcurementManager:
                       row_data=row)
             return None
 
-    def _format_approval_details(self, approval_details: List[Dict[str, Any]]) -> Dict[str, str]:
+    def _format_approval_details(self, approval_details: List[ApprovalDetail]) -> Dict[str, str]:
         """Format approval details into markdown tables."""
         if not approval_details:
             return {"main": "No approval details found."}
@@ -1150,19 +1826,6 @@ class OracleProcurementManager:
             "Document Creator"
         ]
 
-        doc_rows = [
-            [
-                detail["document"],
-                detail["document_type"],
-                detail["document_creation_date"],
-                detail["document_submission_date"],
-                detail["ou"],
-                detail["supplier"],
-                detail["doc_creator"]
-            ]
-            for detail in approval_details
-        ]
-
         # Approval Workflow Table
         workflow_headers = [
             "Document",
@@ -1175,20 +1838,6 @@ class OracleProcurementManager:
             "Status"
         ]
 
-        workflow_rows = [
-            [
-                detail["document"],
-                detail["line_num"],
-                f"{detail['assignee']} ({detail['username']})",
-                detail["assignee_manager"],
-                detail["assignment_date"],
-                f"{detail['days_elapsed']:.1f}",
-                detail["time_elapsed"],
-                detail["description"]
-            ]
-            for detail in approval_details
-        ]
-
         # Line Items Table
         items_headers = [
             "Document",
@@ -1202,20 +1851,50 @@ class OracleProcurementManager:
             "CO Qty"
         ]
 
-        items_rows = [
-            [
-                detail["document"],
-                detail["line_num"],
-                detail["item"],
-                f"{detail['quantity']:,.2f}",
-                f"${detail['price']:,.2f}",
-                f"${detail['extended_price']:,.2f}",
-                detail["location_code"],
-                detail["change_order_desc"],
-                f"{detail['change_order_qty']:,.2f}" if detail['change_order_qty'] != 0 else ""
-            ]
-            for detail in approval_details
-        ]
+        # The summary has one row per document and the items table one row per
+        # document line, each taken from the first record seen for it
+        documents = {}
+        document_lines = {}
+        add_document = documents.setdefault
+        add_document_line = document_lines.setdefault
+        for detail in approval_details:
+            add_document(detail.document, detail)
+            add_document_line((detail.document, detail.line_num), detail)
+
+        # Transpose once per table and build each one by zipping its columns
+        doc_columns = _approval_columns(documents.values())
+        doc_rows = zip(
+            doc_columns["document"],
+            doc_columns["document_type"],
+            doc_columns["document_creation_date"],
+            doc_columns["document_submission_date"],
+            doc_columns["ou"],
+            doc_columns["supplier"],
+            doc_columns["doc_creator"]
+        )
+        columns = _approval_columns(approval_details)
+        workflow_rows = zip(
+            columns["document"],
+            columns["line_num"],
+            map("{} ({})".format, columns["assignee"], columns["username"]),
+            columns["assignee_manager"],
+            columns["assignment_date"],
+            map(_format_days, columns["days_elapsed"]),
+            columns["time_elapsed"],
+            columns["description"]
+        )
+        item_columns = _approval_columns(document_lines.values())
+        items_rows = zip(
+            item_columns["document"],
+            item_columns["line_num"],
+            item_columns["item"],
+            map(_format_amount, item_columns["quantity"]),
+            map(_format_price, item_columns["price"]),
+            map(_format_price, item_columns["extended_price"]),
+            item_columns["location_code"],
+            item_columns["change_order_desc"],
+            [_format_amount(qty) if qty != 0 else "" for qty in item_columns["change_order_qty"]]
+        )
 
         return {
             "document_summary": self._create_markdown_table(
@@ -1319,7 +1998,7 @@ class OracleProcurementManager:
             Logger.log("Getting supplier configurations", level="INFO")
             
             # Use the correct report path
-            report_path = "/Custom/Square SCM Reports/Block MCP/Procurement/Supplier Contacts and B2B Config Report.xdo"
+            report_path = SUPPLIER_CONFIG_REPORT
             
             # Initialize parameters dict
             parameters = {}
@@ -1327,21 +2006,12 @@ class OracleProcurementManager:
             # Add optional parameters if provided
             if Supplier is not None:
                 # Translate user input to Oracle recognized supplier name
-                oracle_supplier = self.supplier_lookup.translate(Supplier)
-                if not self.supplier_lookup.validate(oracle_supplier):
-                    Logger.log("Invalid supplier provided",
-                             level="WARNING",
-                             input_supplier=Supplier,
-                             translated_supplier=oracle_supplier)
-                parameters["P_SUPPLIER"] = oracle_supplier            
+                parameters["P_SUPPLIER"] = _translate_supplier(Supplier)
             
             Logger.log("Getting supplier configs with parameters", level="INFO", parameters=parameters)
             
             # Get report data
-            report_data = await self.report_service.get_report_data(
-                report_path=report_path,
-                parameters=parameters
-            )
+            report_data = await self._get_report_data(report_path, parameters)
             
             Logger.log("Processing supplier configuration data", level="INFO")
             
@@ -1385,28 +2055,16 @@ class OracleProcurementManager:
 
     async def _process_supplier_config_data(self, report_data: Union[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
         """Process the supplier configuration report data."""
-        configs = []
         try:
-            # If report_data is an awaitable, await it
-            if hasattr(report_data, '__await__'):
-                report_data = await report_data
-
-            # If report_data is a string, treat it as a file path
+            # If report_data is a string, treat it as a file path streamed through
+            # the row processor on a worker thread
             if isinstance(report_data, str):
-                with open(report_data, 'r', newline='', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    rows = list(reader)
-            else:
-                # Otherwise, treat it as the row data directly
-                rows = report_data
-
-            # Process each row
-            for row in rows:
-                config = self._process_supplier_config_row(row)
-                if config:
-                    configs.append(config)
-
-            return configs
+                return await asyncio.to_thread(
+                    self._collect_csv_file, report_data, _SUPPLIER_CONFIG_COLUMNS,
+                    self._process_supplier_config_row_positional, self._process_supplier_config_row
+                )
+            # Otherwise, treat it as the row data directly
+            return self._collect_rows(report_data, self._process_supplier_config_row)
 
         except Exception as e:
             Logger.log("Error processing supplier configuration data",
@@ -1457,6 +2115,30 @@ class OracleProcurementManager:
                       row_data=row)
             return None
 
+    def _process_supplier_config_row_positional(
+        self,
+        row: List[str],
+        columns: Callable[[List[str]], tuple],
+        trimmed: bool = _REPORTS_TRIMMED
+    ) -> Optional[Dict[str, Any]]:
+        """Process a csv.reader row of the supplier configuration report.
+        
+        Args:
+            row: Row values in file order
+            columns: itemgetter returning the _SUPPLIER_CONFIG_COLUMNS values of a row, in order
+            trimmed: Skip stripping the values (see ENV_TRIMMED_REPORTS)
+        """
+        try:
+            values = columns(row)
+            return dict(zip(_SUPPLIER_CONFIG_KEYS, values if trimmed else map(str.strip, values)))
+
+        except Exception as e:
+            Logger.log("Error processing supplier config row",
+                      level="ERROR",
+                      error_message=str(e),
+                      row_data=row)
+            return None
+
     def _format_supplier_configs(self, supplier_configs: List[Dict[str, Any]]) -> Dict[str, str]:
         """Format supplier configurations into three main sections:
         1. Supplier Details
@@ -1466,75 +2148,21 @@ class OracleProcurementManager:
         if not supplier_configs:
             return {"main": "No supplier configurations found."}
 
-        # Supplier Details Table
-        supplier_details_headers = [
-            "Field",
-            "Value"
-        ]
-
-        supplier_details_rows = [
-            ["Supplier Name", supplier_configs[0].get("SUPPLIER_NAME", "")],
-            ["Supplier Number", supplier_configs[0].get("SUPPLIER_NUMBER", "")],
-            ["Contact First Name", supplier_configs[0].get("PERSON_FIRST_NAME", "")],
-            ["Contact Last Name", supplier_configs[0].get("PERSON_LAST_NAME", "")],
-            ["Portal User Name", supplier_configs[0].get("USERNAME", "")],
-            ["Portal User Access", supplier_configs[0].get("ACCESS_LEVEL", "")],
-            ["Portal User Access To", supplier_configs[0].get("ACCESS_TO", "")],
-            ["Portal User Roles Access", supplier_configs[0].get("ROLE", "")],
-            ["Contact Email", supplier_configs[0].get("EMAIL_ADDRESS", "")]
-        ]
-
-        # Supplier Site Details Table
-        site_details_headers = [
-            "Field",
-            "Value"
-        ]
-
-        site_details_rows = [
-            ["Supplier Site", supplier_configs[0].get("VENDOR_SITE_CODE", "")],
-            ["Proc BU", supplier_configs[0].get("NAME", "")],
-            ["Purchasing Site Flag", supplier_configs[0].get("PURCHASING_SITE_FLAG", "")],
-            ["RFQ Site Flag", supplier_configs[0].get("RFQ_ONLY_SITE_FLAG", "")],
-            ["Pay Site Flag", supplier_configs[0].get("PAY_SITE_FLAG", "")],
-            ["Primary Pay Site Flag", supplier_configs[0].get("PRIMARY_PAY_SITE_FLAG", "")],
-            ["Eff Start Date", supplier_configs[0].get("EFFECTIVE_START_DATE", "")],
-            ["Eff End Date", supplier_configs[0].get("EFFECTIVE_END_DATE", "")],
-            ["Supplier Notification Method", supplier_configs[0].get("SUPPLIER_NOTIF_METHOD", "")],
-            ["Supplier Email Address", supplier_configs[0].get("Supplier Email Address", "")]
-        ]
-
-        # Supplier Site B2B/EDI Details Table
-        b2b_details_headers = [
-            "Field",
-            "Value"
-        ]
-
-        b2b_details_rows = [
-            ["Supplier Site", supplier_configs[0].get("VENDOR_SITE_CODE", "")],
-            ["Proc BU", supplier_configs[0].get("NAME", "")],
-            ["Service Provider Name", supplier_configs[0].get("SERVICE_PROVIDER_NAME", "")],
-            ["B2B Comm Method", supplier_configs[0].get("B2B_COMM_METHOD_CODE", "")],
-            ["B2B Docs", supplier_configs[0].get("DOCS", "")]
-        ]
-
+        # All three tables describe the first configuration; only the value cells
+        # are rendered here, the rest of each table is precomputed
+        config_get = supplier_configs[0].get
         return {
-            "supplier_details": self._create_markdown_table(
-                headers=supplier_details_headers,
-                rows=supplier_details_rows,
-                title="Supplier Details"
-            ),
-            "site_details": self._create_markdown_table(
-                headers=site_details_headers,
-                rows=site_details_rows,
-                title="Supplier Site Details"
-            ),
-            "b2b_details": self._create_markdown_table(
-                headers=b2b_details_headers,
-                rows=b2b_details_rows,
-                title="Supplier Site B2B/EDI Details"
-            )
+            name: head + "\n".join(
+                f"{label_cell}{_format_cell(config_get(key, ''))} |" for label_cell, key in rows
+            ) + "\n"
+            for name, (head, rows) in _SUPPLIER_CONFIG_TABLES.items()
         }
 
+@lru_cache(maxsize=1)
 def get_oracle_procurement() -> OracleProcurementManager:
-    """Factory function to create and return an OracleProcurementManager instance."""
+    """Factory function to create and return an OracleProcurementManager instance.
+    
+    The manager holds no per-call state, so one instance is shared by every tool
+    call; get_oracle_procurement.cache_clear() forces a fresh one.
+    """
     return OracleProcurementManager()
\ No newline at end of file
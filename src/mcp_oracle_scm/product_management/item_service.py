@@ -1,7 +1,12 @@
 """Oracle Item Management Module"""
 
+import asyncio
 from datetime import datetime
+from functools import lru_cache
+from itertools import compress, islice, zip_longest
+from operator import itemgetter
 from typing import Optional, Dict, Any, Union, List
+import csv
 import os
 import json
 from mcp_oracle_scm.common.report_service import OracleReportService
@@ -25,6 +30,56 @@ FIELD_MAPPING = {
     'SKU_PRICE': 'SKU Price'
 }
 
+def _parse_d2c(value: str) -> bool:
+    """Items shared through SKU sharing are D2C enabled."""
+    return value == 'SKU Sharing'
+
+def _parse_flag(value: str) -> bool:
+    """Convert a Y/N flag to a boolean."""
+    return value == 'Y'
+
+def _parse_price(value: str) -> Optional[float]:
+    """Convert a SKU price to float, logging and returning None when it is invalid."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        Logger.log("Invalid SKU price value",
+                 level="WARNING",
+                 value=value)
+        return None
+
+# Converters for the fields that are not kept as text; empty values stay None
+_FIELD_CONVERTERS = {
+    'ITEM_EFF': _parse_d2c,  # Special handling for "SKU Sharing" value
+    'RING_FENCING_ENABLED_FLAG': _parse_flag,
+    'SKU_PRICE': _parse_price
+}
+
+# (report field, display name, converter or None) for every FIELD_MAPPING field
+_ITEM_FIELDS = tuple(
+    (oracle_field, display_field, _FIELD_CONVERTERS.get(oracle_field))
+    for oracle_field, display_field in FIELD_MAPPING.items()
+)
+_ITEM_DISPLAY_NAMES = tuple(display_field for _, display_field, _ in _ITEM_FIELDS)
+_item_values = itemgetter(*_ITEM_DISPLAY_NAMES)
+_D2C_COLUMN = _ITEM_DISPLAY_NAMES.index('D2C Enabled')
+
+def _items_to_columns(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert items to a columnar payload: field names once and one value list per field."""
+    columns = zip(*map(_item_values, items)) if items else ((),) * len(_ITEM_DISPLAY_NAMES)
+    return {
+        "fields": list(_ITEM_DISPLAY_NAMES),
+        "columns": dict(zip(_ITEM_DISPLAY_NAMES, map(list, columns)))
+    }
+
+# Item reports are mapped this many rows at a time, so only one chunk of raw rows
+# and transposed columns is held alongside the finished items
+ITEM_CHUNK_SIZE = 50_000
+
+# Set MCP_DEBUG_DUMP=Yes to write each item report's raw content and parsed rows
+# to a .debug file next to it
+ENV_DEBUG_DUMP = "MCP_DEBUG_DUMP"
+
 class ItemService:
     """Service class for retrieving and managing item details from Oracle."""
 
@@ -42,7 +97,9 @@ class ItemService:
         p_org: Optional[str],
         p_category: Optional[str],
         offset_days: Optional[int],
-        p_d2c: Optional[str]
+        p_d2c: Optional[str],
+        *,
+        columnar: bool = False
     ) -> Dict[str, Any]:
         """Look up item details using the Oracle BI Report.
         
@@ -52,6 +109,9 @@ class ItemService:
             p_category: Optional item category to filter by
             offset_days: Optional number of days to offset the search
             p_d2c: Optional filter for D2C enabled items ('Y' or 'N')
+            columnar: Return items as {"fields", "columns"} with one value list per
+                field instead of one dict per item; grouped_items indices then
+                address positions in each column
         """
         try:
             start_time = datetime.now()
@@ -97,93 +157,15 @@ class ItemService:
                       file=report_file)
             
             # Process the report file
-            items = []
-            raw_data = {"headers": None, "rows": []}
+            debug_file = None
+            if os.getenv(ENV_DEBUG_DUMP, "No").upper() == "YES":
+                debug_file = report_file + ".debug"
             
             try:
-                # First check if file exists and is readable
-                if not os.path.exists(report_file):
-                    Logger.log("Report file not found",
-                             level="ERROR",
-                             file=report_file)
-                    raise FileNotFoundError(f"Report file not found: {report_file}")
-                
-                # Check file size
-                file_size = os.path.getsize(report_file)
-                Logger.log("Report file size",
-                          level="DEBUG",
-                          size_bytes=file_size)
-                
-                # Read the entire file content for inspection
-                with open(report_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    
-                    if not content:
-                        Logger.log("Empty file received from report",
-                                 level="ERROR")
-                        raise ValueError("Empty file received from report")
-                    
-                    # Save raw data for debugging
-                    debug_file = report_file + ".debug"
-                    with open(debug_file, 'w') as df:
-                        df.write(f"Original Content:\n{content}\n\n")
-                
-                # Process the file line by line
-                with open(report_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    
-                    if not lines:
-                        Logger.log("No data in report file",
-                                 level="ERROR")
-                        raise ValueError("No data in report file")
-                    
-                    # Get and process headers
-                    headers = [h.strip().strip('"') for h in lines[0].strip().split(',')]
-                    raw_data["headers"] = headers
-                    Logger.log("CSV headers processed",
-                             level="DEBUG",
-                             headers=headers)
-                    
-                    # Process each line
-                    for line in lines[1:]:
-                        if line.strip():  # Skip empty lines
-                            # Split line and clean values
-                            values = [v.strip().strip('"') for v in line.strip().split(',')]
-                            raw_data["rows"].append(values)
-                            
-                            # Create row dict
-                            row = dict(zip(headers, values))
-                            Logger.log("Processing row",
-                                     level="DEBUG",
-                                     row=row)
-                            
-                            try:
-                                # Process row
-                                item = self._process_item_row(row)
-                                if item:  # Only add non-None items
-                                    items.append(item)
-                            except Exception as e:
-                                Logger.log("Error processing row",
-                                         level="ERROR",
-                                         error=str(e),
-                                         row=row)
-                                continue
-                
-                # Save raw data to debug file
-                with open(debug_file, 'a') as df:
-                    df.write("\nProcessed Data:\n")
-                    json.dump(raw_data, df, indent=2)
-                    
-                # Filter items by D2C status if p_d2c parameter is provided
-                if p_d2c is not None:
-                    original_count = len(items)
-                    d2c_value = True if p_d2c == 'Y' else False
-                    items = [item for item in items if item.get('D2C Enabled') == d2c_value]
-                    Logger.log("Filtered items by D2C status",
-                             level="INFO",
-                             d2c_value=d2c_value,
-                             original_count=original_count,
-                             filtered_count=len(items))
+                # Read and map the file on a worker thread, keeping the event loop free;
+                # items are filtered by D2C status if p_d2c parameter is provided
+                d2c_value = None if p_d2c is None else p_d2c == 'Y'
+                items = await asyncio.to_thread(self._read_item_report, report_file, debug_file, d2c_value)
                     
             except Exception as e:
                 Logger.log("Error reading item details file",
@@ -216,8 +198,8 @@ class ItemService:
                     }.items() if v is not None
                 },
                 "grouped_items": grouped_items,
-                "items": items,
-                "debug_file": report_file + ".debug"  # Include debug file path in response
+                "items": _items_to_columns(items) if columnar else items,
+                "debug_file": debug_file  # Debug file path when MCP_DEBUG_DUMP is set, else None
             }
             
         except Exception as e:
@@ -245,103 +227,183 @@ class ItemService:
                 }
             }
     
-    def _process_item_row(self, row: Dict[str, str]) -> Optional[Dict[str, Any]]:
-        """Process a single item row from the report."""
-        Logger.log("Processing row data",
-                  level="DEBUG",
-                  row=row)
+    def _read_item_report(
+        self,
+        report_file: str,
+        debug_file: Optional[str],
+        d2c_value: Optional[bool] = None
+    ) -> List[Dict[str, Any]]:
+        """Read an item details report file and map its rows to items.
         
-        # Skip empty rows
-        if not any(row.values()):
-            return None
+        Blocking; called through asyncio.to_thread from lookup_item_details.
         
-        # Create a new dictionary with mapped field names
-        processed_row = {}
+        Args:
+            report_file: Path of the downloaded report
+            debug_file: Path to write the raw content and parsed rows to, or None
+            d2c_value: Keep only items whose D2C Enabled value equals this, if given
+        """
+        items = []
+        row_count = 0
+        debug_enabled = Logger.is_debug_enabled()
         
-        # Process each field according to the mapping
-        for oracle_field, display_field in FIELD_MAPPING.items():
-            # Get the value, handling case where field might not exist
-            value = row.get(oracle_field, '')
+        # First check that the file exists and get its size with a single stat call
+        try:
+            file_size = os.stat(report_file).st_size
+        except FileNotFoundError:
+            Logger.log("Report file not found",
+                     level="ERROR",
+                     file=report_file)
+            raise FileNotFoundError(f"Report file not found: {report_file}")
+        if debug_enabled:
+            Logger.log("Report file size",
+                      level="DEBUG",
+                      size_bytes=file_size)
+        
+        # Save raw data for debugging
+        if debug_file:
+            with open(report_file, 'r', encoding='utf-8') as f, open(debug_file, 'w') as df:
+                df.write(f"Original Content:\n{f.read().strip()}\n\n")
+        
+        # Stream the file through csv.reader, which unquotes fields and keeps
+        # quoted commas inside their field
+        with open(report_file, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
             
-            # Strip any quotes and whitespace
-            if isinstance(value, str):
-                value = value.strip().strip('"')
+            # Get and process headers
+            headers = [h.strip() for h in next(reader, ())]
+            if not any(headers):
+                Logger.log("Empty file received from report",
+                         level="ERROR")
+                raise ValueError("Empty file received from report")
+            if debug_enabled:
+                Logger.log("CSV headers processed",
+                         level="DEBUG",
+                         headers=headers)
             
-            # Convert empty strings to None
-            if value == "":
-                processed_row[display_field] = None
-                continue
+            # Skip rows with no value under any header, checked with one join
+            # per row, and map the rest to items one chunk at a time; values
+            # are cleaned column by column as they are mapped
+            width = len(headers)
+            report_rows = (record for record in reader if ''.join(record[:width]).strip())
+            debug_rows = [] if debug_file else None
+            while True:
+                chunk = list(islice(report_rows, ITEM_CHUNK_SIZE))
+                if not chunk:
+                    break
+                items.extend(self._process_item_rows(headers, chunk, d2c_value))
+                row_count += len(chunk)
+                if debug_rows is not None:
+                    debug_rows.extend(chunk)
+        
+        # Save raw data to debug file
+        if debug_file:
+            with open(debug_file, 'a') as df:
+                df.write("\nProcessed Data:\n")
+                json.dump({"headers": headers, "rows": debug_rows}, df, separators=(',', ':'))
+        
+        if d2c_value is not None:
+            Logger.log("Filtered items by D2C status",
+                     level="INFO",
+                     d2c_value=d2c_value,
+                     original_count=row_count,
+                     filtered_count=len(items))
+        
+        return items
+    
+    def _process_item_rows(
+        self,
+        headers: List[str],
+        rows: List[List[str]],
+        d2c_value: Optional[bool] = None
+    ) -> List[Dict[str, Any]]:
+        """Map non-blank report rows to items, converting one column at a time.
+        
+        The rows are used as csv.reader produced them and transposed once, so
+        each FIELD_MAPPING field is cleaned and converted in a single pass over
+        its column; the converted columns are then zipped back into one dict
+        per row. Given d2c_value, rows are filtered on the converted D2C
+        Enabled column first, so no dict is built for a dropped row.
+        """
+        if not rows:
+            return []
+        
+        positions = {header: i for i, header in enumerate(headers)}
+        # Short rows are padded, as a missing field reads as empty
+        columns = list(zip_longest(*rows, fillvalue=''))
+        missing = ('',) * len(rows)
+        
+        converted = []
+        for oracle_field, _, convert in _ITEM_FIELDS:
+            i = positions.get(oracle_field)
+            column = columns[i] if i is not None and i < len(columns) else missing
             
-            # Special handling for D2C enabled
-            if oracle_field == 'ITEM_EFF':
-                processed_row[display_field] = (value == 'SKU Sharing')
-                continue
-                
-            # Convert boolean fields
-            if oracle_field == 'RING_FENCING_ENABLED_FLAG':
-                processed_row[display_field] = (value == 'Y')
-                continue
-                
-            # Convert numeric fields
-            if oracle_field == 'SKU_PRICE':
-                try:
-                    processed_row[display_field] = float(value) if value else None
-                except (ValueError, TypeError):
-                    Logger.log("Invalid SKU price value",
-                             level="WARNING",
-                             value=value)
-                    processed_row[display_field] = None
-                continue
+            # Strip any quotes and whitespace and convert empty strings to None
+            column = [value.strip().strip('"') or None for value in column]
+            if convert is not None:
+                column = [None if value is None else convert(value) for value in column]
             
-            # Default handling
-            processed_row[display_field] = value
+            converted.append(column)
+        
+        records = zip(*converted)
+        if d2c_value is not None:
+            records = compress(records, [value == d2c_value for value in converted[_D2C_COLUMN]])
+        items = [dict(zip(_ITEM_DISPLAY_NAMES, values)) for values in records]
         
-        Logger.log("Processed row",
-                  level="DEBUG",
-                  processed=processed_row)
-        return processed_row
+        # Called once per chunk: skip building the log context unless DEBUG is on
+        if Logger.is_debug_enabled():
+            Logger.log("Processed item rows",
+                      level="DEBUG",
+                      item_count=len(items))
+        return items
     
     def _group_items(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Group items by category and warehouse."""
-        by_category = {}
-        by_warehouse = {}
+        """Group items by category and warehouse.
+        
+        Groups hold positions in items rather than copies of the item dicts, so
+        each item appears once in the response.
+        """
+        category_items = {}
+        warehouse_items = {}
         d2c_enabled = []
         ring_fenced = []
         
         try:
-            # Group by category
-            for item in items:
-                category = item.get('Item Category')
+            # Group by category and warehouse and track the special configurations
+            # in a single pass over the items
+            for index, item in enumerate(items):
+                get = item.get
+                category = get('Item Category')
                 if category:
-                    if category not in by_category:
-                        by_category[category] = {
-                            'total_items': 0,
-                            'items': []
-                        }
-                    
-                    by_category[category]['total_items'] += 1
-                    by_category[category]['items'].append(item)
-            
-            # Group by warehouse
-            for item in items:
-                warehouse = item.get('Organization/Warehouse')
+                    group = category_items.get(category)
+                    if group is None:
+                        category_items[category] = [index]
+                    else:
+                        group.append(index)
+                
+                warehouse = get('Organization/Warehouse')
                 if warehouse:
-                    if warehouse not in by_warehouse:
-                        by_warehouse[warehouse] = {
-                            'total_items': 0,
-                            'items': []
-                        }
-                    
-                    by_warehouse[warehouse]['total_items'] += 1
-                    by_warehouse[warehouse]['items'].append(item)
+                    group = warehouse_items.get(warehouse)
+                    if group is None:
+                        warehouse_items[warehouse] = [index]
+                    else:
+                        group.append(index)
                     
                 # Track D2C enabled items
-                if item.get('D2C Enabled'):
-                    d2c_enabled.append(item)
+                if get('D2C Enabled'):
+                    d2c_enabled.append(index)
                     
                 # Track ring-fenced items
-                if item.get('Ring Fencing Enabled'):
-                    ring_fenced.append(item)
+                if get('Ring Fencing Enabled'):
+                    ring_fenced.append(index)
+            
+            by_category = {
+                category: {'total_items': len(group), 'item_indices': group}
+                for category, group in category_items.items()
+            }
+            by_warehouse = {
+                warehouse: {'total_items': len(group), 'item_indices': group}
+                for warehouse, group in warehouse_items.items()
+            }
 
             Logger.log("Items grouped successfully",
                       level="INFO",
@@ -354,8 +416,8 @@ class ItemService:
                 'by_category': by_category,
                 'by_warehouse': by_warehouse,
                 'special_configurations': {
-                    'd2c_enabled': d2c_enabled,
-                    'ring_fenced': ring_fenced
+                    'd2c_enabled_indices': d2c_enabled,
+                    'ring_fenced_indices': ring_fenced
                 }
             }
             
@@ -365,8 +427,13 @@ class ItemService:
                       error=str(e))
             raise
 
+@lru_cache(maxsize=1)
 def get_item_service() -> ItemService:
-    """Get configured Item Service client."""
+    """Get configured Item Service client.
+    
+    The client is created once and shared; a failed initialization is not
+    cached, so the next call retries it.
+    """
     try:
         return ItemService()
     except Exception as e:
@@ -1,7 +1,8 @@
 """Oracle SCM MCP Server"""
 
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Union, List
+from typing import AsyncIterator, Optional, Dict, Any, Union, List
 from mcp.server import FastMCP
 import logging
 import os
@@ -22,7 +23,7 @@ from mcp_oracle_scm.inventory.inventory_service import (
     OracleInventoryManager,
     get_oracle_inventory_manager
 )
-from mcp_oracle_scm.procurement.procurement_service import get_oracle_procurement
+from mcp_oracle_scm.procurement.procurement_service import get_oracle_procurement, PO_LINE_PAGE_SIZE
 from mcp_oracle_scm.product_management.item_service import get_item_service
 from mcp_oracle_scm.common.report_service import OracleReportService
 from mcp_oracle_scm.config.environment import get_env_config
@@ -39,6 +40,243 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Alias tables for Order Management report parameters ('customer input' => 'parameter value').
+# Parsed once at import into lowercase lookup dicts so tool inputs are normalized server-side.
+_BU_ALIASES = """
+USA => US
+CVU => US
+United States => US
+Domestic => US
+America => US
+US => US
+States => US
+Ceva US => US
+US => US
+CA => Canada
+canada => Canada
+CANADA => Canada
+CVC => Canada
+IMC => Canada
+Ceva Canada => Canada
+Canada => Canada
+GBR => UK
+GB => UK
+United Kingdom => UK
+London => UK
+Britain => UK
+UK => UK
+AU => Australia
+AUS => Australia
+Sydney => Australia
+Arvato => Australia
+ARV => Australia
+DBS Australia => Australia
+SYD => Australia
+Australia => Australia
+Europe => Ireland
+EU => Ireland
+Netherland => Ireland
+NLD => Ireland
+IE => Ireland
+Ireland => Ireland
+Paris => Ireland
+France => Ireland
+SCH => Japan
+DBS => Japan
+DBS Japan => Japan
+JP => Japan
+Japan => Japan
+Bitkey => Bitcoin HW US
+Bitkey US => Bitcoin HW US
+Bitcoin => Bitcoin HW US
+Bitcoin US => Bitcoin HW US
+Bitkey domestic => Bitcoin HW US
+Bitcoin Domestic => Bitcoin HW US
+BK US => Bitcoin HW US
+MLU => Bitcoin HW US
+BK domestic => Bitcoin HW US
+Moduslink US => Bitcoin HW US
+Moduslink => Bitcoin HW US
+ML => Bitcoin HW US
+ML US => Bitcoin HW US
+Moduslink domestic => Bitcoin HW US
+Bitcoin Hardware => Bitcoin HW US
+Bitcoin HW => Bitcoin HW US
+Bitkey HW => Bitcoin HW US
+Bitkey Hardware => Bitcoin HW US
+Bitcoin HW US => Bitcoin HW US
+Bitcoin HW NL => Bitcoin HW NL
+Bitkey Intl => Bitcoin HW NL
+Bitcoin INTL => Bitcoin HW NL
+Bitcoin International => Bitcoin HW NL
+Bitkey International => Bitcoin HW NL
+ML Intl => Bitcoin HW NL
+ML International => Bitcoin HW NL
+MLI => Bitcoin HW NL
+BK International => Bitcoin HW NL
+Moduslink Intl => Bitcoin HW NL
+Moduslink International => Bitcoin HW NL
+Proto Global => Proto Global
+Proto => Proto Global
+ASE => Proto Global
+FMY => Proto Global
+Mining => Proto Global
+R2 => Proto Global
+MC2 => Proto Global
+"""
+
+_WAREHOUSE_ALIASES = """
+USA => CVU
+CVU => CVU
+United States => CVU
+Domestic => CVU
+America => CVU
+US => CVU
+States => CVU
+Ceva US => CVU
+US => CVU
+Jusda => JDU
+CA => IMC
+canada => IMC
+CANADA => IMC
+CVC => IMC
+IMC => IMC
+Ceva Canada => IMC
+Canada => IMC
+GBR => GBR
+GB => GBR
+United Kingdom => GBR
+London => GBR
+Britain => GBR
+UK => GBR
+AU => ARV
+AUS => ARV
+Sydney => ARV
+Arvato => ARV
+ARV => ARV
+DBS Australia => ARV
+SYD => ARV
+Australia => ARV
+Europe => NLD
+EU => NLD
+Netherland => NLD
+NLD => NLD
+IE => NLD
+Ireland => NLD
+Paris => NLD
+France => NLD
+SCH => SCH
+DBS => SCH
+DBS Japan => SCH
+JP => SCH
+Japan => SCH
+Bitkey => MLU
+Bitkey US => MLU
+Bitcoin => MLU
+Bitcoin US => MLU
+Bitkey domestic => MLU
+Bitcoin Domestic => MLU
+BK US => MLU
+MLU => MLU
+BK domestic => MLU
+Moduslink US => MLU
+Moduslink => MLU
+ML => MLU
+ML US => MLU
+Moduslink domestic => MLU
+Bitcoin Hardware => MLU
+Bitcoin HW => MLU
+Bitkey HW => MLU
+Bitkey Hardware => MLU
+Bitcoin HW US => MLU
+Bitcoin HW NL => MLI
+Bitkey Intl => MLI
+Bitcoin INTL => MLI
+Bitcoin International => MLI
+Bitkey International => MLI
+ML Intl => MLI
+ML International => MLI
+MLI => MLI
+BK International => MLI
+Moduslink Intl => MLI
+Moduslink International => MLI
+Singapore Mining => SGM
+Singapore D2C => SGU
+Foxconn Malaysia => FMY
+Foxconn MY => FMY
+Mining MY => FMY
+Mining San Jose => FSJ
+Mining SJC => FSJ
+Foxconn San Jose => FSJ
+"""
+
+_SOURCE_ALIASES = """
+Manual => OPS
+OPS => OPS
+SHOP => SHOP
+Ecom => SHOP
+E-Comm => SHOP
+Ecommerce => SHOP
+B2C => SHOP
+BigCommerce => BC
+BC => BC
+BigComm => BC
+Retail => EDI
+Distributor => EDI
+EDI => EDI
+B2B => EDI
+CPQ => SFDC
+Enterprise => SFDC
+SalesForce => SFDC
+SF => SFDC
+SFDC => SFDC
+GSHEET => GSHEET
+"""
+
+_ORDER_TYPE_ALIASES = """
+ECOM NORMAL ZERO SHIPONLY => ECOM_NORMAL_ZERO_SHIPONLY
+SQ SHIP ONLY => SQ_SHIP_ONLY
+RETAIL NORMAL SHIPONLY => RETAIL_NORMAL_SHIPONLY
+SQ SCRAP => SQ_SCRAP
+SQ WARRANTY => SQ_WARRANTY
+TRANSFER ORDER SHIPONLY => TRANSFER_ORDER_SHIPONLY
+ECOM NORMAL SHIPONLY => ECOM_NORMAL_SHIPONLY
+SQ EFFA ORDERS => SQ_EFFA
+SQ Scrap Unavlbl => SQ_SCRAP_UNAVL
+ENTERPRISE NORMAL SHIPONLY => ENTERPRISE_NORMAL_SHIPONLY
+SQ P00 ORDERS => SQ_P00_ORDERS
+ECOM NORMAL STANDARD => ECOM_NORMAL_STANDARD
+ECOM WARRANTY SHIPONLY => ECOM_WARRANTY_SHIPONLY
+RETAIL NORMAL STANDARD => RETAIL_NORMAL_STANDARD
+"""
+
+
+def _parse_alias_table(table: str) -> Dict[str, str]:
+    """Parse 'alias => value' lines into a dict keyed by the lowercased alias."""
+    mapping = {}
+    for line in table.splitlines():
+        alias, sep, value = line.partition("=>")
+        if sep:
+            mapping[alias.strip().lower()] = value.strip()
+    # Canonical values are valid inputs too, whatever their casing
+    for value in set(mapping.values()):
+        mapping.setdefault(value.lower(), value)
+    return mapping
+
+
+BU_MAP = _parse_alias_table(_BU_ALIASES)
+WAREHOUSE_MAP = _parse_alias_table(_WAREHOUSE_ALIASES)
+SOURCE_MAP = _parse_alias_table(_SOURCE_ALIASES)
+ORDER_TYPE_MAP = _parse_alias_table(_ORDER_TYPE_ALIASES)
+
+
+def _normalize_alias(value: Optional[str], mapping: Dict[str, str]) -> Optional[str]:
+    """Map a user supplied alias to its report parameter value, leaving unknown values as-is."""
+    if not value:
+        return value
+    return mapping.get(value.strip().lower(), value)
+
+
 # Create an MCP server
 instructions = """
 Oracle SCM MCP Server
@@ -80,11 +318,11 @@ Available Modules:
            - EXAMPLE QUERIES: "How many orders in last 30 days?", "Get order count for CA", "How many SHOP orders created for DBS", "get me the details of last years 'Sales Force' Orders"
            - Parameters for BI Report:
                 > offset_days: For time period (e.g., 7, 30, 90)
-                > p_bu: Business Unit filter (e.g., 'US', 'UK', 'Canada'). User might not pass exact business unit. So use # Common Business Unit Mapping shared below to derive correct p_bu from customer input.
+                > p_bu: Business Unit filter (e.g., 'US', 'UK', 'Canada'). Common aliases (e.g. 'USA', 'CVC', 'Bitkey') are normalized by the server.
                     
-                > p_source: Order source filter (e.g., 'SHOP', 'EDI', 'SFDC', 'OPS'). Use # Common Order Source Mapping shared below to derive correct p_source from customer input. Whie displaying output, show customer info from the report.
+                > p_source: Order source filter (e.g., 'SHOP', 'EDI', 'SFDC', 'OPS'). Common aliases (e.g. 'Retail', 'CPQ', 'Manual') are normalized by the server. Whie displaying output, show customer info from the report.
                     
-                > p_order_type: Type filter (e.g., 'ECOM_NORMAL_SHIPONLY'). Use # Common Order Type Mapping shared below to derive correct p_order_type from customer input.
+                > p_order_type: Type filter (e.g., 'ECOM_NORMAL_SHIPONLY'). Common aliases (e.g. 'ECOM NORMAL SHIPONLY') are normalized by the server.
 
        * check_single_order_details: Get details for a specific order number with simplified output
 
@@ -94,7 +332,7 @@ Available Modules:
           - Parameters for BI Report:
                 > offset_days: Time period to look back
                 > p_sku: Filter by specific SKU
-                > p_warehouse: Filter by warehouse code. Use # Common Warehouse Mapping shared below to derive correct 3 digit warehouse from customer input
+                > p_warehouse: Filter by warehouse code. Common aliases (e.g. 'Canada', 'Bitkey US') are normalized by the server to the 3 letter warehouse code
 
        * extract_order_line_details: Extract order line details by running Oracle BI Report and group report output based on user need. Do NOT call this tool if user ask is about a specific order type or order source (retail, cpq, manual etc).
                                      When query is made for certain order source or order type, route to "get_order_count" tool
@@ -103,7 +341,7 @@ Available Modules:
           - Parameters for BI Report:
                 > offset_days: Time period to look back
                 > p_sku: Filter by specific SKU
-                > p_warehouse: Filter by warehouse code. Use # Common Warehouse Mapping shared below to derive correct 3 digit warehouse from customer input
+                > p_warehouse: Filter by warehouse code. Common aliases (e.g. 'Canada', 'Bitkey US') are normalized by the server to the 3 letter warehouse code
 
        * get_open_orders:  Check the details of current open stuck sales orders using BI Report and present the output to user in tabular format for better understanding.
                            Do NOT call this tool when user specifically asks about Back Orders.
@@ -113,7 +351,7 @@ Available Modules:
           - Parameters for BI Report:
                 > offset_days: Time period for search
                 > p_sku: Filter by SKU
-                > p_warehouse: Filter by warehouse. Use # Common Warehouse Mapping shared below to derive correct 3 digit warehouse from customer input
+                > p_warehouse: Filter by warehouse. Common aliases (e.g. 'Canada', 'Bitkey US') are normalized by the server to the 3 letter warehouse code
 
        * get_back_orders: Get Square Backorder Details by running Oracle BI Report and present the output to user in tabular format for better understanding.
                           Don't call this tool unless user specifically ask about back orders. Never run this BI report for more than 30 days.
@@ -125,217 +363,11 @@ Available Modules:
           - Parameters for BI Report:
                 > p_from_sales_ord_date: Start date (MM-DD-YYYY)
                 > p_to_sales_ord_date: End date (MM-DD-YYYY)
-                > p_warehouse: Filter by warehouse.  Use # Common Warehouse Mapping shared below to derive correct 3 digit warehouse from customer input
+                > p_warehouse: Filter by warehouse.  Common aliases (e.g. 'Canada', 'Bitkey US') are normalized by the server to the 3 letter warehouse code
                 > p_item: Filter by specific item/SKU
 
 
-    Common mappings to be used by the above mentioned 6 Order Management tools:
-
-       # Common Business Unit Mapping: (while determining BI report input parameter "p_bu" in "get_order_count" tool, use this mapping.)
-            USA => US
-            CVU => US
-            United States => US
-            Domestic => US
-            America => US
-            US => US
-            States => US
-            Ceva US => US
-            US => US
-            CA => Canada
-            canada => Canada
-            CANADA => Canada
-            CVC => Canada
-            IMC => Canada
-            Ceva Canada => Canada
-            Canada => Canada
-            GBR => UK
-            GB => UK
-            United Kingdom => UK
-            London => UK
-            Britain => UK
-            UK => UK
-            AU => Australia
-            AUS => Australia
-            Sydney => Australia
-            Arvato => Australia
-            ARV => Australia
-            DBS Australia => Australia
-            SYD => Australia
-            Australia => Australia
-            Europe => Ireland
-            EU => Ireland
-            Netherland => Ireland
-            NLD => Ireland
-            IE => Ireland
-            Ireland => Ireland
-            Paris => Ireland
-            France => Ireland
-            SCH => Japan
-            DBS => Japan
-            DBS Japan => Japan
-            JP => Japan
-            Japan => Japan
-            Bitkey => Bitcoin HW US
-            Bitkey US => Bitcoin HW US
-            Bitcoin => Bitcoin HW US
-            Bitcoin US => Bitcoin HW US
-            Bitkey domestic => Bitcoin HW US
-            Bitcoin Domestic => Bitcoin HW US
-            BK US => Bitcoin HW US
-            MLU => Bitcoin HW US
-            BK domestic => Bitcoin HW US
-            Moduslink US => Bitcoin HW US
-            Moduslink => Bitcoin HW US
-            ML => Bitcoin HW US
-            ML US => Bitcoin HW US
-            Moduslink domestic => Bitcoin HW US
-            Bitcoin Hardware => Bitcoin HW US
-            Bitcoin HW => Bitcoin HW US
-            Bitkey HW => Bitcoin HW US
-            Bitkey Hardware => Bitcoin HW US
-            Bitcoin HW US => Bitcoin HW US
-            Bitcoin HW NL => Bitcoin HW NL
-            Bitkey Intl => Bitcoin HW NL
-            Bitcoin INTL => Bitcoin HW NL
-            Bitcoin International => Bitcoin HW NL
-            Bitkey International => Bitcoin HW NL
-            ML Intl => Bitcoin HW NL
-            ML International => Bitcoin HW NL
-            MLI => Bitcoin HW NL
-            BK International => Bitcoin HW NL
-            Moduslink Intl => Bitcoin HW NL
-            Moduslink International => Bitcoin HW NL
-            Proto Global => Proto Global
-            Proto => Proto Global
-            ASE => Proto Global
-            FMY => Proto Global
-            Mining => Proto Global
-            R2 => Proto Global
-            MC2 => Proto Global
-
-        # Common Warehouse Mapping:
-            User might not always provide correct 3-letter warehouse code to be passed. So read customer input and use the below 'customer input' => 'p_warehouse' mapping to decide the warehouse.
-            'p_warehouse' parameter is being used by all these three tools: "get_order_line_summary", "extract_order_line_details", "get_open_orders", "get_back_orders"
-            USA => CVU
-            CVU => CVU
-            United States => CVU
-            Domestic => CVU
-            America => CVU
-            US => CVU
-            States => CVU
-            Ceva US => CVU
-            US => CVU
-            Jusda => JDU
-            CA => IMC
-            canada => IMC
-            CANADA => IMC
-            CVC => IMC
-            IMC => IMC
-            Ceva Canada => IMC
-            Canada => IMC
-            GBR => GBR
-            GB => GBR
-            United Kingdom => GBR
-            London => GBR
-            Britain => GBR
-            UK => GBR
-            AU => ARV
-            AUS => ARV
-            Sydney => ARV
-            Arvato => ARV
-            ARV => ARV
-            DBS Australia => ARV
-            SYD => ARV
-            Australia => ARV
-            Europe => NLD
-            EU => NLD
-            Netherland => NLD
-            NLD => NLD
-            IE => NLD
-            Ireland => NLD
-            Paris => NLD
-            France => NLD
-            SCH => SCH
-            DBS => SCH
-            DBS Japan => SCH
-            JP => SCH
-            Japan => SCH
-            Bitkey => MLU
-            Bitkey US => MLU
-            Bitcoin => MLU
-            Bitcoin US => MLU
-            Bitkey domestic => MLU
-            Bitcoin Domestic => MLU
-            BK US => MLU
-            MLU => MLU
-            BK domestic => MLU
-            Moduslink US => MLU
-            Moduslink => MLU
-            ML => MLU
-            ML US => MLU
-            Moduslink domestic => MLU
-            Bitcoin Hardware => MLU
-            Bitcoin HW => MLU
-            Bitkey HW => MLU
-            Bitkey Hardware => MLU
-            Bitcoin HW US => MLU
-            Bitcoin HW NL => MLI
-            Bitkey Intl => MLI
-            Bitcoin INTL => MLI
-            Bitcoin International => MLI
-            Bitkey International => MLI
-            ML Intl => MLI
-            ML International => MLI
-            MLI => MLI
-            BK International => MLI
-            Moduslink Intl => MLI
-            Moduslink International => MLI
-            Singapore Mining => SGM
-            Singapore D2C => SGU
-            Foxconn Malaysia => FMY
-            Foxconn MY => FMY
-            Mining MY => FMY
-            Mining San Jose => FSJ
-            Mining SJC => FSJ
-            Foxconn San Jose => FSJ
-
-        # Common Order Source Mapping (while determining BI report input parameter "p_source" in "get_order_count" tool, use this mapping.)
-            Manual => OPS
-            OPS => OPS
-            SHOP => SHOP
-            Ecom => SHOP
-            E-Comm => SHOP
-            Ecommerce => SHOP
-            B2C => SHOP
-            BigCommerce => BC
-            BC => BC
-            BigComm => BC
-            Retail => EDI
-            Distributor => EDI
-            EDI => EDI
-            B2B => EDI
-            CPQ => SFDC
-            Enterprise => SFDC
-            SalesForce => SFDC
-            SF => SFDC
-            SFDC => SFDC
-            GSHEET => GSHEET
-
-        # Common Order Type Mapping (while determining BI report input parameter "p_order_type" in "get_order_count" tool, use this mapping.)
-            ECOM NORMAL ZERO SHIPONLY => ECOM_NORMAL_ZERO_SHIPONLY
-            SQ SHIP ONLY => SQ_SHIP_ONLY
-            RETAIL NORMAL SHIPONLY => RETAIL_NORMAL_SHIPONLY
-            SQ SCRAP => SQ_SCRAP
-            SQ WARRANTY => SQ_WARRANTY
-            TRANSFER ORDER SHIPONLY => TRANSFER_ORDER_SHIPONLY
-            ECOM NORMAL SHIPONLY => ECOM_NORMAL_SHIPONLY
-            SQ EFFA ORDERS => SQ_EFFA
-            SQ Scrap Unavlbl => SQ_SCRAP_UNAVL
-            ENTERPRISE NORMAL SHIPONLY => ENTERPRISE_NORMAL_SHIPONLY
-            SQ P00 ORDERS => SQ_P00_ORDERS
-            ECOM NORMAL STANDARD => ECOM_NORMAL_STANDARD>
-            ECOM WARRANTY SHIPONLY => ECOM_WARRANTY_SHIPONLY
-            RETAIL NORMAL STANDARD => RETAIL_NORMAL_STANDARD
+    Server auto-normalizes BU/warehouse/source/type aliases for the above mentioned 6 Order Management tools.
 
     
 
@@ -718,10 +750,19 @@ Environment Configuration:
 The server handles authentication and provides formatted responses for easy integration.
 """.strip()
 
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Release shared resources when the server shuts down."""
+    try:
+        yield
+    finally:
+        await OracleReportService.aclose()
+
 # Initialize the MCP server
 mcp = FastMCP(
     "mcp_oracle_scm",
-    instructions=instructions
+    instructions=instructions,
+    lifespan=server_lifespan
 )
 
 
@@ -883,6 +924,9 @@ async def get_order_count(
         p_source: Order source to filter by (default: 'SHOP')
         p_order_type: Order type to filter by (default: 'ECOM_NORMAL_SHIPONLY')
     """
+    p_bu = _normalize_alias(p_bu, BU_MAP)
+    p_source = _normalize_alias(p_source, SOURCE_MAP)
+    p_order_type = _normalize_alias(p_order_type, ORDER_TYPE_MAP)
     try:
         Logger.log("Getting order count",
                   level="INFO",
@@ -984,6 +1028,7 @@ async def get_order_line_summary(
         p_sku: Optional SKU number to filter by (e.g., 'A-SKU-0525')
         p_warehouse: Optional warehouse code to filter by (e.g., 'MLU', 'CVU')
     """
+    p_warehouse = _normalize_alias(p_warehouse, WAREHOUSE_MAP)
     try:
         Logger.log("Getting order line summary",
                   level="INFO",
@@ -1044,6 +1089,7 @@ async def get_open_orders(
         p_sku: Optional SKU number to filter by (e.g., 'A-SKU-0525')
         p_warehouse: Optional warehouse code to filter by (e.g., 'MLU', 'CVU')
     """
+    p_warehouse = _normalize_alias(p_warehouse, WAREHOUSE_MAP)
     try:
         Logger.log("Getting open orders",
                   level="INFO",
@@ -1101,6 +1147,7 @@ async def extract_order_line_details(
         p_sku: Optional SKU number to filter by (e.g., 'A-SKU-0525')
         p_warehouse: Optional warehouse code to filter by (e.g., 'MLU', 'CVU')
     """
+    p_warehouse = _normalize_alias(p_warehouse, WAREHOUSE_MAP)
     try:
         Logger.log("Extracting order line details",
                   level="INFO",
@@ -1160,6 +1207,7 @@ async def get_back_orders(
         p_warehouse: Optional warehouse code to filter by (e.g., 'CVU')
         p_item: Optional SKU number to filter by (e.g., 'A-SKU-0525')
     """
+    p_warehouse = _normalize_alias(p_warehouse, WAREHOUSE_MAP)
     try:
         Logger.log("Getting back orders",
                   level="INFO",
@@ -1337,7 +1385,8 @@ async def get_po_summary(
     P_CATEGORY: Optional[Union[str, List[str]]] = None,
     P_SUPPLIER: Optional[str] = None,
     P_REQUESTER: Optional[str] = None,
-    P_MANUFACTURER: Optional[str] = None
+    P_MANUFACTURER: Optional[str] = None,
+    formatted: bool = True
 ) -> Dict[str, Any]:
     """Get purchase order summary for a specific year using Oracle BI Report.
     
@@ -1355,6 +1404,7 @@ async def get_po_summary(
         P_SUPPLIER: Optional[str] - Supplier name filter
         P_REQUESTER: Optional[str] - Requester name filter
         P_MANUFACTURER: Optional[str] - Manufacturer name filter
+        formatted: bool - Build markdown formatted_tables (default True); set False when only the data is needed
         
     Returns:
         Dictionary containing:
@@ -1378,7 +1428,8 @@ async def get_po_summary(
             P_CATEGORY=P_CATEGORY,
             P_SUPPLIER=P_SUPPLIER,
             P_REQUESTER=P_REQUESTER,
-            P_MANUFACTURER=P_MANUFACTURER
+            P_MANUFACTURER=P_MANUFACTURER,
+            formatted=formatted
         )
     except Exception as e:
         
@@ -1431,7 +1482,10 @@ async def get_po_details(
     P_BUYER: Optional[str] = None,
     P_SHIP_TO: Optional[str] = None,
     P_PROC_BU: Optional[str] = None,
-    P_BILL_TO: Optional[str] = None
+    P_BILL_TO: Optional[str] = None,
+    formatted: bool = True,
+    page: int = 1,
+    page_size: int = PO_LINE_PAGE_SIZE
 ) -> Dict[str, Any]:
     """Get detailed purchase order information for a specific year using Oracle BI Report.
     
@@ -1453,6 +1507,9 @@ async def get_po_details(
         P_SHIP_TO: Optional ship-to location filter
         P_BILL_TO: Optional bill-to location filter
         P_PROC_BU: Optional Procurement BU location filter
+        formatted: Build markdown formatted_tables (default True); set False when only the data is needed
+        page: Page of line items to return for POs with more than page_size lines (default 1)
+        page_size: Maximum line items returned per PO
     
     Returns:
         Dictionary containing:
@@ -1463,6 +1520,8 @@ async def get_po_details(
           * PO line items
           * Invoice and payment details
           * Change order information
+        - pagination: Present when a PO has more than page_size line items;
+          page, page_size, total_pages and total_line_items per PO
         - execution_time: Time taken to execute the query
         - parameters_used: Parameters used in the query
         - error: Error information if any
@@ -1484,7 +1543,10 @@ async def get_po_details(
             P_MANUFACTURER=P_MANUFACTURER,
             P_BUYER=P_BUYER,
             P_SHIP_TO=P_SHIP_TO,
-            P_BILL_TO=P_BILL_TO
+            P_BILL_TO=P_BILL_TO,
+            formatted=formatted,
+            page=page,
+            page_size=page_size
         )
     except Exception as e:        
         Logger.log("Error in get_po_details:",
@@ -1528,6 +1590,32 @@ async def get_po_details(
             }
         }
 
+@mcp.tool()
+async def get_po_details_auto(P_PONUM: str) -> Dict[str, Any]:
+    """Get detailed purchase order information when the PO year is not known.
+    
+    Looks up the PO's creation year and fetches the details for it in one call,
+    overlapping the year lookup with a detail fetch for the current year.
+    
+    Args:
+        P_PONUM: Purchase order number
+    
+    Returns:
+        Same structure as get_po_details
+    """
+    try:
+        oracle_proc = get_oracle_procurement()
+        return await oracle_proc.get_po_details_auto(P_PONUM=P_PONUM)
+    except Exception as e:
+        Logger.log("Error in get_po_details_auto:",
+                  level="INFO",
+                  parameters={"P_PONUM": P_PONUM})
+        return {
+            "error": str(e),
+            "error_type": type(e).__name__,
+            "parameters": {"P_PONUM": P_PONUM}
+        }
+
 @mcp.tool()
 async def get_pr_po_apprvl_dtls(
     Doc_No: Optional[str] = None,
@@ -1648,7 +1736,8 @@ async def lookup_item_details(
     p_org: Optional[str],
     p_category: Optional[str],
     offset_days: Optional[int],
-    p_d2c: Optional[str]
+    p_d2c: Optional[str],
+    columnar: bool = False
 ) -> Dict[str, Any]:
     """Look up item details using Oracle BI Report.
     
@@ -1660,11 +1749,13 @@ async def lookup_item_details(
         p_category: Optional item category to filter by
         offset_days: Optional number of days to offset the search
         p_d2c: Optional filter for D2C enabled items ('Y' or 'N')
+        columnar: Return items as {"fields", "columns"}, one value list per field,
+            instead of one dict per item (default False); smaller for large results
     
     Returns:
         Dictionary containing:
         - total_items: Number of items found
-        - items: List of item details including:
+        - items: List of item details (or the columnar form) including:
           * Item Category
           * Item Number/SKU/Product
           * Description
@@ -1672,7 +1763,9 @@ async def lookup_item_details(
           * Creation and update information
           * Ring fencing and D2C status
           * SKU Price
-        - grouped_items: Items grouped by category and warehouse
+        - grouped_items: Items grouped by category and warehouse, plus D2C enabled
+          and ring-fenced items; each group lists positions in items
+          (item_indices, d2c_enabled_indices, ring_fenced_indices)
         - parameters_used: Parameters used in the query
         - error: Error information if any
     """
@@ -1691,7 +1784,8 @@ async def lookup_item_details(
             p_org=p_org,
             p_category=p_category,
             offset_days=offset_days,
-            p_d2c=p_d2c
+            p_d2c=p_d2c,
+            columnar=columnar
         )
         
         Logger.log("Item details retrieved",